@@ -178,6 +178,7 @@ def main():
             timeout_seconds=config.serial.timeout_seconds,
             auto_discover=config.serial.auto_discover,
             scan_timeout_seconds=config.serial.scan_timeout_seconds,
+            low_latency=config.serial.low_latency,
         )
 
         # Create real serial protocol
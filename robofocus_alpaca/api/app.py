@@ -197,10 +197,8 @@ def create_app(config: AppConfig) -> FastAPI:
         position = 0
 
         if focuser and connected:
-            if hasattr(focuser.protocol, 'port_name'):
-                current_port = focuser.protocol.port_name or ""
-            if hasattr(focuser.protocol, 'firmware_version'):
-                firmware = focuser.protocol.firmware_version or "--"
+            current_port = focuser.protocol.port_name or ""
+            firmware = focuser.protocol.firmware_version or "--"
             try:
                 position = focuser.get_position()
             except:
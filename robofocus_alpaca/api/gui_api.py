@@ -149,12 +149,11 @@ async def get_status(request: Request):
             # Get firmware version
             if simulator:
                 status.firmware_version = simulator._firmware_version
-            elif hasattr(focuser.protocol, 'firmware_version'):
+            else:
                 status.firmware_version = focuser.protocol.firmware_version
 
             # Get port name
-            if hasattr(focuser.protocol, 'port_name'):
-                status.port = focuser.protocol.port_name
+            status.port = focuser.protocol.port_name
 
         except Exception as e:
             logger.error(f"Error getting focuser status: {e}")
@@ -188,7 +187,8 @@ async def get_ports():
 async def scan_ports():
     """Scan for Robofocus devices on all COM ports."""
     try:
-        devices = scan_for_robofocus(timeout_seconds=1.0)
+        # Explicit user rescan: re-probe ports blacklisted as other devices
+        devices = scan_for_robofocus(timeout_seconds=1.0, fresh=True)
         return [
             DiscoveredDeviceResponse(
                 port=d.port,
@@ -49,7 +49,7 @@ async def get_connected(
     try:
         value = focuser.connected
         response = make_response(value, client_id, get_next_transaction_id())
-        logger.debug(f"GET /connected -> {value}")
+        logger.debug("GET /connected -> %s", value)
         return response
     except Exception as e:
         logger.error(f"Error in /connected: {e}")
@@ -65,7 +65,7 @@ async def get_position(
     try:
         value = focuser.get_position()
         response = make_response(value, client_id, get_next_transaction_id())
-        logger.debug(f"GET /position -> {value}")
+        logger.debug("GET /position -> %s", value)
         return response
     except Exception as e:
         logger.error(f"Error in /position: {e}")
@@ -81,7 +81,7 @@ async def get_ismoving(
     try:
         value = focuser.is_moving
         response = make_response(value, client_id, get_next_transaction_id())
-        logger.debug(f"GET /ismoving -> {value}")
+        logger.debug("GET /ismoving -> %s", value)
         return response
     except Exception as e:
         logger.error(f"Error in /ismoving: {e}")
@@ -97,7 +97,7 @@ async def get_temperature(
     try:
         value = focuser.get_temperature()
         response = make_response(value, client_id, get_next_transaction_id())
-        logger.debug(f"GET /temperature -> {value:.2f}°C")
+        logger.debug("GET /temperature -> %.2f°C", value)
         return response
     except Exception as e:
         logger.error(f"Error in /temperature: {e}")
@@ -296,7 +296,7 @@ async def get_backlash(
     try:
         value = focuser.get_backlash()
         response = make_response(value, client_id, get_next_transaction_id())
-        logger.debug(f"GET /backlash -> {value}")
+        logger.debug("GET /backlash -> %s", value)
         return response
     except Exception as e:
         logger.error(f"Error in /backlash: {e}")
@@ -32,6 +32,9 @@ class SerialConfig(BaseModel):
     scan_timeout_seconds: float = Field(
         default=1.0, ge=0.5, le=10.0, description="Timeout per port during auto-discovery scan"
     )
+    low_latency: bool = Field(
+        default=True, description="Request low-latency mode / 1 ms USB latency timer on connect"
+    )
 
 
 class FocuserConfig(BaseModel):
@@ -9,7 +9,7 @@ in the Robofocus device, these are purely software-side preferences.
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from pydantic import ValidationError
 
@@ -21,6 +21,11 @@ logger = logging.getLogger(__name__)
 # Default settings file location (next to config.json)
 DEFAULT_SETTINGS_FILE = "user_settings.json"
 
+# Last parse per path: path -> (mtime_ns, size, settings), so re-reading an
+# unchanged file skips json.load and pydantic validation. One entry per path,
+# replaced when the file changes.
+_PARSE_CACHE: Dict[str, Tuple[int, int, UserSettings]] = {}
+
 
 class UserSettingsManager:
     """
@@ -29,6 +34,8 @@ class UserSettingsManager:
     Settings are automatically saved when modified.
     """
 
+    __slots__ = ("_path", "_settings")
+
     def __init__(self, path: Optional[str] = None):
         """
         Initialize settings manager.
@@ -48,6 +55,13 @@ class UserSettingsManager:
             return settings
 
         try:
+            st = self._path.stat()
+            path_key = str(self._path)
+            cached = _PARSE_CACHE.get(path_key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                logger.debug("User settings unchanged on disk, reusing parsed %s", self._path)
+                return cached[2].model_copy()
+
             with open(self._path, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
@@ -59,6 +73,7 @@ class UserSettingsManager:
                 data["use_simulator"] = None
 
             settings = UserSettings(**data)
+            _PARSE_CACHE[path_key] = (st.st_mtime_ns, st.st_size, settings.model_copy())
             logger.info(f"User settings loaded from {self._path}")
             return settings
 
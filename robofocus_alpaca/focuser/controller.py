@@ -5,9 +5,9 @@ Manages focuser state and coordinates between API and protocol layers.
 """
 
 import logging
+import queue
 import threading
 import time
-from datetime import datetime
 from typing import Optional
 
 from robofocus_alpaca.protocol.interface import SerialProtocolInterface
@@ -28,13 +28,43 @@ class FocuserController:
     Focuser controller managing state and movement.
     """
 
+    __slots__ = (
+        "protocol",
+        "config",
+        "_app_config",
+        "_config_path",
+        "_connected",
+        "_position_cache",
+        "_last_position_update",
+        "_backlash_cache",
+        "_backlash_cache_time",
+        "_polling_thread",
+        "_move_queue",
+        "_poll_stop",
+        "_movement_done",
+        "_config_dirty",
+        "_save_timer",
+        "_save_lock",
+        "_writer_queue",
+        "_writer_thread",
+    )
+
+    # Halt settle wait (seconds)
+    HALT_SETTLE_TIMEOUT: float = 0.5
+
+    # How long an idle backlash read stays fresh (seconds)
+    BACKLASH_CACHE_TTL: float = 0.5
+
+    # Delay before writing coalesced config changes (seconds)
+    CONFIG_SAVE_DELAY: float = 2.0
+
     def __init__(
         self,
         protocol: SerialProtocolInterface,
         config: FocuserConfig,
         app_config: Optional[AppConfig] = None,
         config_path: Optional[str] = None
-    ):
+    ) -> None:
         """
         Initialize focuser controller.
 
@@ -44,20 +74,39 @@ class FocuserController:
             app_config: Full application config (for saving). Optional.
             config_path: Path to config.json for saving. Optional.
         """
-        self.protocol = protocol
-        self.config = config
-        self._app_config = app_config
-        self._config_path = config_path
+        self.protocol: SerialProtocolInterface = protocol
+        self.config: FocuserConfig = config
+        self._app_config: Optional[AppConfig] = app_config
+        self._config_path: Optional[str] = config_path
 
         # State
-        self._connected = False
-        self._position_cache = 0
-        self._last_position_update: Optional[datetime] = None
-        self._backlash_cache = 0  # Cached backlash value (signed INDI convention)
-
-        # Movement tracking
+        self._connected: bool = False
+        # Last known position. Same lock-free rule as _backlash_cache: only
+        # whole-value stores (never read-modify-write), so no torn updates.
+        self._position_cache: int = 0
+        self._last_position_update: Optional[float] = None  # time.monotonic()
+        # Cached backlash value (signed INDI convention). Read without a lock:
+        # writers compute the value first and publish it with a single store,
+        # and readers load it once into a local.
+        self._backlash_cache: int = 0
+        self._backlash_cache_time: float = 0.0  # time.monotonic()
+
+        # Movement tracking (persistent poller fed by move(); None = shutdown)
         self._polling_thread: Optional[threading.Thread] = None
-        self._stop_polling = threading.Event()
+        self._move_queue: "queue.Queue[Optional[int]]" = queue.Queue()
+        # Set by disconnect(): results of that connection's poller are stale
+        self._poll_stop: threading.Event = threading.Event()
+        self._movement_done: threading.Event = threading.Event()
+        self._movement_done.set()  # No movement in progress
+
+        # Coalesced config writes
+        self._config_dirty: bool = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock: threading.Lock = threading.Lock()
+
+        # Background config writer (single slot, latest snapshot wins)
+        self._writer_queue: "queue.Queue[AppConfig]" = queue.Queue(maxsize=1)
+        self._writer_thread: Optional[threading.Thread] = None
 
         logger.info("FocuserController initialized")
 
@@ -77,25 +126,125 @@ class FocuserController:
             raise RuntimeError("Cannot change protocol while connected. Disconnect first.")
 
         self.protocol = protocol
-        logger.info(f"Protocol changed to {type(protocol).__name__}")
+        logger.info("Protocol changed to %s", type(protocol).__name__)
 
     def _save_config(self) -> None:
-        """Save configuration to file if app_config is available."""
-        if self._app_config and self._config_path:
+        """
+        Save configuration to file if app_config is available.
+
+        Hands a snapshot to the background writer thread so the caller never
+        blocks on disk. A snapshot still waiting to be written is replaced.
+        """
+        if not (self._app_config and self._config_path):
+            return
+
+        snapshot = self._app_config.model_copy(deep=True)
+
+        with self._save_lock:
+            if not self._writer_thread or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._config_writer_loop,
+                    daemon=True
+                )
+                self._writer_thread.start()
+
+            # Latest wins: drop a snapshot the writer hasn't picked up yet
+            try:
+                self._writer_queue.get_nowait()
+                self._writer_queue.task_done()
+            except queue.Empty:
+                pass
+            self._writer_queue.put_nowait(snapshot)
+
+    def _config_writer_loop(self) -> None:
+        """Background thread body: write config snapshots to disk."""
+        while True:
+            snapshot = self._writer_queue.get()
             try:
-                save_config(self._app_config, self._config_path)
+                save_config(snapshot, self._config_path)
             except Exception as e:
-                logger.warning(f"Failed to save config: {e}")
+                logger.warning("Failed to save config: %s", e)
+            finally:
+                self._writer_queue.task_done()
+
+    def _wait_config_written(self) -> None:
+        """Block until all queued config snapshots are on disk."""
+        self._writer_queue.join()
+
+    def _mark_config_dirty(self) -> None:
+        """
+        Schedule a config save.
+
+        Rapid successive changes are coalesced into a single write after
+        CONFIG_SAVE_DELAY seconds of quiet.
+        """
+        with self._save_lock:
+            self._config_dirty = True
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.CONFIG_SAVE_DELAY, self._flush_config)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_config(self) -> None:
+        """Write pending config changes now, if any."""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            dirty = self._config_dirty
+            self._config_dirty = False
+
+        if dirty:
+            self._save_config()
 
     def save_config(self) -> None:
-        """Public method to save configuration."""
+        """
+        Public method to save configuration (immediately).
+
+        Cancels any pending coalesced save and returns once the file has
+        been written by the writer thread.
+        """
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._config_dirty = False
         self._save_config()
+        self._wait_config_written()
 
     @property
     def connected(self) -> bool:
-        """Check if focuser is connected."""
+        """
+        Check if focuser is connected.
+
+        Returns the flag maintained by connect()/disconnect(); use
+        verify_connection() for an explicit check against the protocol.
+        """
+        return self._connected
+
+    def verify_connection(self) -> bool:
+        """
+        Check the connection against the protocol layer (slow path).
+
+        Returns:
+            True if connected and the protocol link is up, False otherwise.
+        """
         return self._connected and self.protocol.is_connected()
 
+    def _check_connected_fast(self) -> None:
+        """
+        Cheap connection check for read-heavy polling paths.
+
+        Only tests the controller flag; full protocol verification is done
+        at connect/disconnect/move boundaries.
+
+        Raises:
+            NotConnectedError: If not connected.
+        """
+        if not self._connected:
+            raise NotConnectedError("Focuser not connected")
+
     def connect(self) -> None:
         """
         Connect to focuser hardware.
@@ -114,77 +263,99 @@ class FocuserController:
 
         # Read initial position
         self._position_cache = self.protocol.get_position()
-        self._last_position_update = datetime.now()
+        self._last_position_update = time.monotonic()
 
-        # Query hardware settings
+        # Query hardware settings (the backlash cache only counts once read)
+        self._backlash_cache_time = 0.0
         self._query_hardware_settings()
 
-        logger.info(f"Focuser connected at position {self._position_cache}")
+        # Start movement poller (idle until move() signals it)
+        self._start_polling_thread()
+
+        logger.info("Focuser connected at position %d", self._position_cache)
 
     def _query_hardware_settings(self) -> None:
         """Query and log hardware settings after connection, and save to config."""
         config_changed = False
 
         # Save firmware version
-        if hasattr(self.protocol, 'firmware_version') and self.protocol.firmware_version:
-            if self.config.firmware_version != self.protocol.firmware_version:
-                self.config.firmware_version = self.protocol.firmware_version
+        firmware_version = self.protocol.firmware_version
+        if firmware_version:
+            if self.config.firmware_version != firmware_version:
+                self.config.firmware_version = firmware_version
                 config_changed = True
-                logger.info(f"Saved firmware version to config: {self.protocol.firmware_version}")
+                logger.info("Saved firmware version to config: %s", firmware_version)
 
         # Save serial port
-        if self._app_config and hasattr(self.protocol, 'port_name'):
-            port_name = self.protocol.port_name
+        port_name = self.protocol.port_name
+        if self._app_config and port_name is not None:
             if self._app_config.serial.port != port_name:
                 self._app_config.serial.port = port_name
                 config_changed = True
-                logger.info(f"Saved serial port to config: {port_name}")
+                logger.info("Saved serial port to config: %s", port_name)
 
-        try:
-            # Read max travel from hardware - hardware is the source of truth
-            hw_max_travel = self.protocol.get_max_travel()
-            if hw_max_travel > 0:
-                if hw_max_travel != self.config.max_step:
-                    logger.info(f"Hardware max travel: {hw_max_travel} (config was {self.config.max_step})")
-                    self.config.max_step = hw_max_travel
-                    config_changed = True
-                else:
-                    logger.debug(f"Hardware max travel matches config: {hw_max_travel}")
-        except Exception as e:
-            logger.warning(f"Could not read max travel from hardware: {e}")
+        # Read max travel and backlash in one pass (failed queries come back None)
+        hw_settings = self.protocol.query_all_settings()
 
-        try:
-            # Read backlash settings from hardware
-            direction, amount = self.protocol.get_backlash()
+        # Max travel - hardware is the source of truth
+        hw_max_travel = hw_settings.max_travel
+        if hw_max_travel is not None and hw_max_travel > 0:
+            if hw_max_travel != self.config.max_step:
+                logger.info("Hardware max travel: %d (config was %d)", hw_max_travel, self.config.max_step)
+                self.config.max_step = hw_max_travel
+                config_changed = True
+            else:
+                logger.debug("Hardware max travel matches config: %d", hw_max_travel)
+
+        if hw_settings.backlash is not None:
+            direction, amount = hw_settings.backlash
             direction_str = "IN" if direction == 2 else "OUT"
             # Cache the value (convert to signed INDI convention)
-            self._backlash_cache = -amount if direction == 2 else amount
+            backlash = -amount if direction == 2 else amount
+            self._backlash_cache = backlash
+            self._backlash_cache_time = time.monotonic()
             # Save to config
-            if self.config.backlash_steps != self._backlash_cache:
-                self.config.backlash_steps = self._backlash_cache
+            if self.config.backlash_steps != backlash:
+                self.config.backlash_steps = backlash
                 config_changed = True
-            logger.info(f"Hardware backlash: {amount} steps on {direction_str} motion")
-        except Exception as e:
-            logger.warning(f"Could not read backlash from hardware: {e}")
+            logger.info("Hardware backlash: %d steps on %s motion", amount, direction_str)
 
         # Save config if anything changed
         if config_changed:
-            self._save_config()
+            self._mark_config_dirty()
 
     def disconnect(self) -> None:
         """Disconnect from focuser hardware."""
-        if not self._connected:
-            return
+        # Release any halt() still waiting for the poller
+        self._movement_done.set()
+
+        # Queue any pending config changes; the writer thread saves them
+        # while the port is being closed
+        self._flush_config()
+
+        try:
+            if not self._connected:
+                return
+
+            # Stop polling thread
+            if self._polling_thread:
+                self._poll_stop.set()
+                self._move_queue.put(None)
+                self._polling_thread.join(timeout=5.0)
+                if self._polling_thread.is_alive():
+                    # Still tracking a long move; it exits on its own sentinel
+                    logger.warning("Movement poller still running after disconnect")
+                else:
+                    self._polling_thread = None
 
-        # Stop polling thread
-        if self._polling_thread:
-            self._stop_polling.set()
-            self._polling_thread.join(timeout=5.0)
+            self.protocol.disconnect()
+            self._connected = False
 
-        self.protocol.disconnect()
-        self._connected = False
+            logger.info("Focuser disconnected")
 
-        logger.info("Focuser disconnected")
+        finally:
+            # Make sure the config is on disk before returning
+            self._wait_config_written()
 
     def get_position(self) -> int:
         """
@@ -198,15 +369,14 @@ class FocuserController:
         Raises:
             NotConnectedError: If not connected.
         """
-        if not self.connected:
-            raise NotConnectedError("Focuser not connected")
+        self._check_connected_fast()
 
         # ALWAYS call protocol.get_position() - it handles all states internally:
         # - IDLE: sends FG query
         # - MOVING_PROGRAMMATIC: returns cached position
         # - MOVING_EXTERNAL: reads buffer to detect when movement ends
         self._position_cache = self.protocol.get_position()
-        self._last_position_update = datetime.now()
+        self._last_position_update = time.monotonic()
         return self._position_cache
 
     @property
@@ -214,12 +384,15 @@ class FocuserController:
         """
         Check if focuser is moving.
 
+        Moves started by move() are answered from the poller's completion
+        event; the protocol is only asked otherwise (e.g. handset movement).
+
         Returns:
             True if moving, False if idle.
         """
-        if not self.connected:
+        if not self._connected:
             return False
-        return self.protocol.is_moving()
+        return not self._movement_done.is_set() or self.protocol.is_moving()
 
     def move(self, target: int) -> None:
         """
@@ -232,38 +405,34 @@ class FocuserController:
             NotConnectedError: If not connected.
             InvalidValueError: If target out of range or exceeds max_increment.
         """
-        if not self.connected:
+        if not self.verify_connection():
             raise NotConnectedError("Focuser not connected")
 
+        # Read limits once (the GUI may change them on the shared config at runtime)
+        config = self.config
+        min_step, max_step, max_increment = config.min_step, config.max_step, config.max_increment
+
         # Validate range
-        if target < self.config.min_step or target > self.config.max_step:
+        if not min_step <= target <= max_step:
             raise InvalidValueError(
-                f"Position {target} out of range [{self.config.min_step}, {self.config.max_step}]"
+                f"Position {target} out of range [{min_step}, {max_step}]"
             )
 
         # Validate max_increment
         delta = abs(target - self._position_cache)
-        if delta > self.config.max_increment:
+        if delta > max_increment:
             raise InvalidValueError(
-                f"Move delta {delta} exceeds max_increment {self.config.max_increment}"
+                f"Move delta {delta} exceeds max_increment {max_increment}"
             )
 
-        # Clamp to limits (safety)
-        target = max(self.config.min_step, min(target, self.config.max_step))
-
         # Start movement
         self.protocol.move_absolute(target)
 
-        # Start polling thread if not already running
-        if not self._polling_thread or not self._polling_thread.is_alive():
-            self._stop_polling.clear()
-            self._polling_thread = threading.Thread(
-                target=self._poll_movement,
-                daemon=True
-            )
-            self._polling_thread.start()
+        # Hand the move to the poller
+        self._movement_done.clear()
+        self._move_queue.put(target)
 
-        logger.info(f"Movement started: {self._position_cache} -> {target}")
+        logger.info("Movement started: %d -> %d", self._position_cache, target)
 
     def halt(self) -> None:
         """
@@ -272,17 +441,22 @@ class FocuserController:
         Raises:
             NotConnectedError: If not connected.
         """
-        if not self.connected:
+        if not self.verify_connection():
             raise NotConnectedError("Focuser not connected")
 
         self.protocol.halt()
 
+        # Wait for the poller to see the move end, then make sure the protocol
+        # reports idle (covers moves the poller isn't tracking, e.g. handset)
+        deadline = time.monotonic() + self.HALT_SETTLE_TIMEOUT
+        self._movement_done.wait(timeout=self.HALT_SETTLE_TIMEOUT)
+        self.protocol.wait_until_idle(max(0.0, deadline - time.monotonic()))
+
         # Update position cache
-        time.sleep(0.5)  # Wait for movement to stop
         self._position_cache = self.protocol.get_position()
-        self._last_position_update = datetime.now()
+        self._last_position_update = time.monotonic()
 
-        logger.info(f"Movement halted at position {self._position_cache}")
+        logger.info("Movement halted at position %d", self._position_cache)
 
     def get_temperature(self) -> float:
         """
@@ -295,37 +469,84 @@ class FocuserController:
             NotConnectedError: If not connected.
             SensorError: If sensor not available.
         """
-        if not self.connected:
-            raise NotConnectedError("Focuser not connected")
+        self._check_connected_fast()
 
         return self.protocol.get_temperature()
 
-    def _poll_movement(self) -> None:
+    def _start_polling_thread(self) -> None:
+        """Start the long-lived movement polling thread."""
+        # Each poller owns its queue, so a poller outliving disconnect never
+        # reads jobs meant for the next connection's poller
+        self._move_queue = queue.Queue()
+        self._poll_stop = threading.Event()
+        self._polling_thread = threading.Thread(
+            target=self._poll_loop,
+            args=(self._move_queue, self._poll_stop),
+            daemon=True
+        )
+        self._polling_thread.start()
+
+    def _poll_loop(self, jobs: "queue.Queue[Optional[int]]", stop: threading.Event) -> None:
         """
-        Background thread to wait for movement completion.
+        Background thread body: take moves queued by move() and track each one.
+
+        Lives for the whole connection so moves don't pay thread start-up cost.
+        A None job stops the thread.
+
+        Args:
+            jobs: This connection's move queue.
+            stop: This connection's stop event (set by disconnect()).
+        """
+        logger.debug("Movement poller started")
+
+        while True:
+            target = jobs.get()
+            if target is None:
+                break
+            self._poll_movement(stop)
+
+        logger.debug("Movement poller stopped")
+
+    def _poll_movement(self, stop: threading.Event) -> None:
+        """
+        Wait for movement completion (runs on the poller thread).
 
         Uses protocol.wait_for_movement_end() which blocks until movement
         finishes (receives 'F' + position packet). This is aligned with
         the INDI driver architecture.
+
+        If the connection this move belongs to was closed meanwhile (stop
+        set), the result is dropped so it can't touch a newer session.
+
+        Args:
+            stop: Stop event of the connection that started the move.
         """
-        logger.debug("Movement polling thread started")
+        logger.debug("Tracking movement")
 
         try:
             # Block until movement finishes
             # wait_for_movement_end() reads I/O/F chars and returns final position
             final_position = self.protocol.wait_for_movement_end()
-
-            self._position_cache = final_position
-            self._last_position_update = datetime.now()
-            logger.info(f"Movement completed at position {final_position}")
-
         except Exception as e:
-            logger.error(f"Error in movement polling thread: {e}")
+            if stop.is_set():
+                logger.debug("Movement tracking ended by disconnect: %s", e)
+                return
+            logger.error("Error in movement polling thread: %s", e)
             # Ensure movement state is reset on error
-            if hasattr(self.protocol, '_is_moving_flag'):
-                self.protocol._is_moving_flag = False
+            self.protocol.reset_movement_state()
+            self._movement_done.set()
+            return
 
-        logger.debug("Movement polling thread stopped")
+        if stop.is_set():
+            logger.debug("Dropping movement result from a closed connection")
+            return
+
+        self._position_cache = final_position
+        self._last_position_update = time.monotonic()
+        logger.info("Movement completed at position %d", final_position)
+        self._movement_done.set()
+
+        logger.debug("Movement tracking finished")
 
     def get_backlash(self) -> int:
         """
@@ -336,7 +557,8 @@ class FocuserController:
         - Negative value = IN motion compensation
         - Zero = no compensation
 
-        Returns cached value during movement to avoid serial communication issues.
+        Returns cached value during movement to avoid serial communication issues,
+        and when idle if the last hardware read is younger than BACKLASH_CACHE_TTL.
 
         Returns:
             Backlash amount (-255 to +255).
@@ -344,12 +566,16 @@ class FocuserController:
         Raises:
             NotConnectedError: If not connected.
         """
-        if not self.connected:
-            raise NotConnectedError("Focuser not connected")
+        self._check_connected_fast()
 
         # Return cached value during movement
-        if self.protocol.is_moving():
-            logger.debug(f"Backlash query during movement, returning cached value: {self._backlash_cache}")
+        if self.is_moving:
+            backlash = self._backlash_cache
+            logger.debug("Backlash query during movement, returning cached value: %d", backlash)
+            return backlash
+
+        # Clients poll this as often as Position; serve recent reads from cache
+        if time.monotonic() - self._backlash_cache_time < self.BACKLASH_CACHE_TTL:
             return self._backlash_cache
 
         # Query hardware when idle and update cache
@@ -358,14 +584,17 @@ class FocuserController:
 
             # Convert to signed value (INDI convention)
             # direction 2 = IN = negative, direction 3 = OUT = positive
-            self._backlash_cache = -amount if direction == 2 else amount
+            backlash = -amount if direction == 2 else amount
+            self._backlash_cache = backlash
+            self._backlash_cache_time = time.monotonic()
 
-            return self._backlash_cache
+            return backlash
 
         except MovementInProgressError:
             # Movement started between our check and the query
-            logger.debug(f"Movement started during backlash query, returning cached: {self._backlash_cache}")
-            return self._backlash_cache
+            backlash = self._backlash_cache
+            logger.debug("Movement started during backlash query, returning cached: %d", backlash)
+            return backlash
 
     def set_backlash(self, value: int) -> None:
         """
@@ -383,28 +612,33 @@ class FocuserController:
             NotConnectedError: If not connected.
             InvalidValueError: If value out of range.
         """
-        if not self.connected:
+        if not self.verify_connection():
             raise NotConnectedError("Focuser not connected")
 
         if value < -255 or value > 255:
             raise InvalidValueError(f"Backlash must be -255 to +255, got {value}")
 
-        # Convert signed value to direction + amount
-        if value >= 0:
-            direction = 3  # OUT motion
-            amount = value
-        else:
-            direction = 2  # IN motion
-            amount = -value
+        # Skip the serial round-trip when clients re-send an unchanged value,
+        # but only if the cache reflects the hardware (read or written since
+        # connect); after a failed read it is just the default 0
+        if (self._backlash_cache_time > 0.0 and value == self._backlash_cache
+                and self.config.backlash_steps == value):
+            logger.debug("Backlash already %d, skipping hardware write", value)
+            return
+
+        # Convert signed value to direction + amount (3 = OUT motion, 2 = IN motion)
+        direction = 3 if value >= 0 else 2
+        amount = abs(value)
 
         self.protocol.set_backlash(direction, amount)
 
         # Update cache
         self._backlash_cache = value
+        self._backlash_cache_time = time.monotonic()
 
         # Update config and save
         if self.config.backlash_steps != value:
             self.config.backlash_steps = value
-            self._save_config()
+            self._mark_config_dirty()
 
-        logger.info(f"Backlash set to {value} ({'OUT' if value >= 0 else 'IN'} motion, {amount} steps)")
+        logger.info("Backlash set to %d (%s motion, %d steps)", value, "OUT" if direction == 3 else "IN", amount)
@@ -2,12 +2,13 @@
 Protocol package for Robofocus serial communication.
 """
 
-from robofocus_alpaca.protocol.interface import SerialProtocolInterface
+from robofocus_alpaca.protocol.interface import SerialProtocolInterface, HardwareSettings
 from robofocus_alpaca.protocol.robofocus_serial import RobofocusSerial
 from robofocus_alpaca.protocol.port_scanner import (
     PortInfo,
     DiscoveredDevice,
     list_available_ports,
+    invalidate_ports_cache,
     scan_for_robofocus,
     find_first_robofocus,
 )
@@ -16,10 +17,12 @@ from robofocus_alpaca.protocol.encoder import encode_command, parse_response
 
 __all__ = [
     "SerialProtocolInterface",
+    "HardwareSettings",
     "RobofocusSerial",
     "PortInfo",
     "DiscoveredDevice",
     "list_available_ports",
+    "invalidate_ports_cache",
     "scan_for_robofocus",
     "find_first_robofocus",
     "calculate_checksum",
@@ -2,13 +2,16 @@
 Checksum calculation and validation for Robofocus protocol.
 """
 
+from typing import Union
 
-def calculate_checksum(message: str) -> int:
+
+def calculate_checksum(message: Union[bytes, str]) -> int:
     """
     Calculate Robofocus checksum (sum of ASCII values modulo 256).
 
     Args:
-        message: 8-character string (e.g., "FG002500").
+        message: 8-byte message (e.g., b"FG002500"); str is accepted and
+            encoded as ASCII.
 
     Returns:
         Checksum byte (0-255).
@@ -20,11 +23,13 @@ def calculate_checksum(message: str) -> int:
         >>> calculate_checksum("FG002500")
         127
     """
+    if isinstance(message, str):
+        message = message.encode("ascii")
+
     if len(message) != 8:
         raise ValueError(f"Message must be exactly 8 characters, got {len(message)}")
 
-    checksum = sum(ord(c) for c in message) % 256
-    return checksum
+    return sum(message) & 0xFF
 
 
 def validate_checksum(packet: bytes) -> bool:
@@ -48,8 +53,7 @@ def validate_checksum(packet: bytes) -> bool:
     if len(packet) != 9:
         raise ValueError(f"Packet must be exactly 9 bytes, got {len(packet)}")
 
-    message = packet[:8].decode("ascii", errors="replace")
     checksum_received = packet[8]
-    checksum_calculated = calculate_checksum(message)
+    checksum_calculated = calculate_checksum(packet[:8])
 
     return checksum_received == checksum_calculated
@@ -2,13 +2,18 @@
 Command encoding for Robofocus protocol.
 """
 
+from functools import lru_cache
+
 from .checksum import calculate_checksum
 
 
+@lru_cache(maxsize=2048)
 def encode_command(cmd: str, value: int) -> bytes:
     """
     Encode command as 9-byte packet.
 
+    Results are memoized: polling repeatedly sends the same few packets.
+
     Args:
         cmd: Two-letter command (e.g., "FG", "FV", "FT").
         value: 6-digit integer (zero-padded).
@@ -29,14 +34,69 @@ def encode_command(cmd: str, value: int) -> bytes:
     if value < 0 or value > 999999:
         raise ValueError(f"Value must be 0-999999, got: {value}")
 
-    # Create 8-character message
-    message = f"{cmd}{value:06d}"
+    # Create 8-byte message
+    message = f"{cmd}{value:06d}".encode("ascii")
+
+    # Append checksum
+    return message + bytes([calculate_checksum(message)])
+
+
+def encode_into(buf: bytearray, cmd: str, value: int) -> bytearray:
+    """
+    Encode command as 9-byte packet into a caller-owned buffer.
+
+    Used for commands whose values rarely repeat (e.g. move targets), where
+    the memoized encode_command() would only churn its cache.
+
+    Args:
+        buf: Buffer of at least 9 bytes; the first 9 are overwritten.
+        cmd: Two-letter command (e.g., "FG").
+        value: 6-digit integer (zero-padded).
+
+    Returns:
+        The same buffer, for convenience.
+
+    Raises:
+        ValueError: If cmd is not 2 characters or value exceeds 999999.
+    """
+    if len(cmd) != 2:
+        raise ValueError(f"Command must be exactly 2 characters, got: {cmd}")
+
+    if value < 0 or value > 999999:
+        raise ValueError(f"Value must be 0-999999, got: {value}")
+
+    buf[0:2] = cmd.encode("ascii")
+    for i in range(7, 1, -1):
+        value, digit = divmod(value, 10)
+        buf[i] = 0x30 + digit
+    buf[8] = sum(buf[0:8]) & 0xFF
+    return buf
 
-    # Calculate checksum
-    checksum = calculate_checksum(message)
 
-    # Return as bytes
-    return message.encode("ascii") + bytes([checksum])
+# Pre-built query packets (value 0) for the fixed command set
+_ZERO_PACKETS = {
+    cmd: encode_command(cmd, 0)
+    for cmd in ("FV", "FG", "FT", "FB", "FL", "FD", "FI", "FO", "FC", "FP", "FQ")
+}
+
+
+def get_zero_packet(cmd: str) -> bytes:
+    """
+    Get the encoded packet for a command with value 0 (query form).
+
+    Args:
+        cmd: Two-letter command (e.g., "FG", "FT").
+
+    Returns:
+        9-byte packet.
+
+    Raises:
+        ValueError: If cmd is not 2 characters.
+    """
+    packet = _ZERO_PACKETS.get(cmd)
+    if packet is None:
+        packet = encode_command(cmd, 0)
+    return packet
 
 
 def parse_response(packet: bytes) -> dict:
@@ -63,31 +123,23 @@ def parse_response(packet: bytes) -> dict:
     if len(packet) != 9:
         raise ValueError(f"Expected 9 bytes, got {len(packet)}")
 
-    # Decode message part
+    # Extract command (only the 2 command bytes are decoded)
     try:
-        message = packet[:8].decode("ascii")
+        cmd = packet[:2].decode("ascii")
     except UnicodeDecodeError as e:
         raise ValueError(f"Invalid ASCII in packet: {e}")
 
-    # Extract command
-    cmd = message[:2]
-
-    # Extract value
-    value_str = message[2:8]
+    # Extract value (int()/float() parse ASCII bytes directly).
+    # Standard format is integer ("002100"); some firmware versions send a
+    # decimal ("003.20"). Pick the parser up front instead of via exception.
+    value_bytes = packet[2:8]
     try:
-        # Try integer first (standard format: "002100")
-        value = int(value_str)
+        value = float(value_bytes) if b"." in value_bytes else int(value_bytes)
     except ValueError:
-        # Try float format (some firmware versions: "003.20")
-        try:
-            value = float(value_str)
-        except ValueError:
-            raise ValueError(f"Invalid numeric value in packet: {value_str}")
-
-    # Validate checksum
-    checksum_received = packet[8]
-    checksum_calculated = calculate_checksum(message)
-    checksum_valid = (checksum_received == checksum_calculated)
+        raise ValueError(f"Invalid numeric value in packet: {value_bytes!r}")
+
+    # Validate checksum inline (sum of first 8 bytes, modulo 256)
+    checksum_valid = (sum(packet[:8]) & 0xFF) == packet[8]
 
     return {
         "cmd": cmd,
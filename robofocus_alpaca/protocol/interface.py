@@ -4,13 +4,29 @@ Abstract interface for serial protocol communication.
 This interface allows transparent substitution between real hardware and simulator.
 """
 
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HardwareSettings:
+    """Settings read from hardware after connection (None if the query failed)."""
+
+    max_travel: Optional[int] = None
+    backlash: Optional[Tuple[int, int]] = None  # (direction, amount)
 
 
 class SerialProtocolInterface(ABC):
     """Abstract base class for serial protocol handlers."""
 
+    __slots__ = ()
+
     @abstractmethod
     def connect(self) -> None:
         """
@@ -59,14 +75,14 @@ class SerialProtocolInterface(ABC):
         pass
 
     @abstractmethod
-    def read_async_chars(self) -> List[str]:
+    def read_async_chars(self) -> bytes:
         """
         Read asynchronous status characters without blocking.
 
         During movement, hardware sends 'I' (inward), 'O' (outward), 'F' (finished).
 
         Returns:
-            List of characters received since last call (e.g., ['O', 'O', 'F']).
+            Characters received since last call (e.g., b"OOF").
         """
         pass
 
@@ -154,6 +170,16 @@ class SerialProtocolInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def reset_movement_state(self) -> None:
+        """
+        Force the movement state back to idle.
+
+        Used by the controller to recover after an error while waiting
+        for movement to end.
+        """
+        pass
+
     @abstractmethod
     def get_backlash(self) -> tuple[int, int]:
         """
@@ -227,3 +253,79 @@ class SerialProtocolInterface(ABC):
             ValueError: If value out of range.
         """
         pass
+
+    @property
+    def firmware_version(self) -> Optional[str]:
+        """Firmware version reported by hardware (None if not available)."""
+        return None
+
+    @property
+    def port_name(self) -> Optional[str]:
+        """Serial port name (None if not backed by a serial port)."""
+        return None
+
+    def wait_until_idle(self, timeout: float) -> bool:
+        """
+        Block until the focuser reports idle.
+
+        The default polls is_moving(); implementations that track movement
+        state with an event should override this to wait on it.
+
+        Args:
+            timeout: Maximum time to wait, in seconds.
+
+        Returns:
+            True if idle, False if still moving when the timeout expired.
+        """
+        deadline = time.monotonic() + timeout
+        while self.is_moving():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def send_commands_batch(self, cmds: List[Tuple[str, int]]) -> List[bytes]:
+        """
+        Send several commands and return their responses in order.
+
+        The default sends them one at a time; implementations may pipeline
+        them into a single write/read round-trip.
+
+        Args:
+            cmds: List of (cmd, value) pairs.
+
+        Returns:
+            List of 9-byte response packets, one per command.
+
+        Raises:
+            NotConnectedError: If not connected.
+            SerialTimeoutError: If a response is missing.
+        """
+        return [self.send_command(cmd, value) for cmd, value in cmds]
+
+    def query_all_settings(self) -> HardwareSettings:
+        """
+        Read all hardware settings (max travel, backlash) in one call.
+
+        Queries are issued back-to-back; a failed query leaves its field None.
+        Implementations may override this to batch the round-trips.
+
+        Returns:
+            HardwareSettings snapshot.
+
+        Raises:
+            NotConnectedError: If not connected.
+        """
+        settings = HardwareSettings()
+
+        try:
+            settings.max_travel = self.get_max_travel()
+        except Exception as e:
+            logger.warning("Could not read max travel from hardware: %s", e)
+
+        try:
+            settings.backlash = self.get_backlash()
+        except Exception as e:
+            logger.warning("Could not read backlash from hardware: %s", e)
+
+        return settings
@@ -5,27 +5,96 @@ Captures TX/RX messages with timestamps for debugging purposes.
 """
 
 import threading
+import time
 from collections import deque
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from itertools import islice
+from typing import List, Optional, Dict, Any, Tuple
 
 from robofocus_alpaca.protocol.encoder import parse_response
 
 
-@dataclass
 class ProtocolMessage:
     """A single protocol message (TX or RX)."""
-    timestamp: str
-    direction: str  # "TX" or "RX"
-    raw_hex: str
-    raw_bytes: List[int]
-    decoded: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
+
+    __slots__ = ("timestamp", "direction", "raw_bytes", "decoded", "error")
+
+    def __init__(
+        self,
+        timestamp: str,
+        direction: str,  # "TX", "RX" or "ERR"
+        raw_bytes: bytes,
+        decoded: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self.timestamp = timestamp
+        self.direction = direction
+        self.raw_bytes = raw_bytes
+        self.decoded = decoded
+        self.error = error
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization (hex/list rendered here)."""
+        return {
+            "timestamp": self.timestamp,
+            "direction": self.direction,
+            "raw_hex": self.raw_bytes.hex().upper(),
+            "raw_bytes": list(self.raw_bytes),
+            "decoded": self.decoded,
+            "error": self.error,
+        }
+
+
+# Printable ASCII bytes; deleting these from a payload leaves only the rest
+_PRINTABLE_ASCII = bytes(range(32, 127))
+_NON_PRINTABLE_ASCII = bytes(range(32)) + bytes(range(127, 256))
+
+
+def _is_rx_error(data: bytes) -> bool:
+    """
+    Cheap log-time check for an empty read or a malformed/corrupt packet.
+
+    Flags the same packets parse_response() would reject or mark invalid:
+    wrong length, bad checksum, non-ASCII command or non-numeric value.
+    """
+    if not data:
+        return True
+    if len(data) >= 9 and data.strip(b"IO"):
+        if len(data) != 9 or (sum(data[:8]) & 0xFF) != data[8] or not data[:2].isascii():
+            return True
+        value_bytes = data[2:8]
+        try:
+            float(value_bytes) if b"." in value_bytes else int(value_bytes)
+        except ValueError:
+            return True
+    return False
+
+
+def _describe_backlash(value: int) -> str:
+    """Describe backlash command value."""
+    if value == 0:
+        return "Query Backlash"
+    direction = value // 100000
+    amount = value % 100000
+    dir_str = "IN" if direction == 2 else "OUT" if direction == 3 else "OFF"
+    return f"Set Backlash: {amount} steps on {dir_str} motion"
+
+
+# Command -> description builder (only the matching entry is evaluated)
+_COMMAND_DESCRIBERS = {
+    "FV": lambda v: "Get Version",
+    "FG": lambda v: f"Move to {v}" if v > 0 else "Query Position",
+    "FD": lambda v: f"Position: {v}",
+    "FT": lambda v: "Get Temperature",
+    "FQ": lambda v: "Halt Movement",
+    "FB": _describe_backlash,
+    "FL": lambda v: f"Max Travel: {v}" if v > 0 else "Query Max Travel",
+    "FC": lambda v: "Motor Config",
+    "FP": lambda v: "Power Switches",
+    "FS": lambda v: f"Sync Position to {v}",
+    "FI": lambda v: f"Move Inward {v} steps",
+    "FO": lambda v: f"Move Outward {v} steps",
+}
 
 
 class ProtocolLogger:
@@ -33,6 +102,10 @@ class ProtocolLogger:
     Thread-safe logger for protocol messages.
 
     Maintains a circular buffer of messages with configurable max size.
+    Records are appended with a single (atomic) deque.append, and decoding is
+    deferred to get_messages(). Producers are not fully serialized (halt()
+    logs TX under the write lock while a movement reader logs RX), so the
+    counters are updated under a small lock of their own.
     """
 
     DEFAULT_MAX_MESSAGES = 500
@@ -44,12 +117,15 @@ class ProtocolLogger:
         Args:
             max_messages: Maximum number of messages to keep in buffer.
         """
+        # Raw records: (timestamp, direction, data, cmd, value or error text)
         self._messages: deque = deque(maxlen=max_messages)
-        self._lock = threading.Lock()
         self._enabled = True
         self._tx_count = 0
         self._rx_count = 0
         self._error_count = 0
+        self._count_lock = threading.Lock()
+        # (epoch second, ISO prefix) - messages in the same second share the prefix
+        self._ts_cache: Tuple[int, str] = (-1, "")
 
     @property
     def enabled(self) -> bool:
@@ -61,6 +137,16 @@ class ProtocolLogger:
         """Enable or disable logging."""
         self._enabled = value
 
+    def _now_iso(self) -> str:
+        """Current local time as ISO 8601 with milliseconds."""
+        ms = int(time.time() * 1000)
+        sec, frac = divmod(ms, 1000)
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec).isoformat()
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{frac:03d}"
+
     def log_tx(self, data: bytes, cmd: str = None, value: int = None) -> None:
         """
         Log a transmitted message.
@@ -73,18 +159,10 @@ class ProtocolLogger:
         if not self._enabled:
             return
 
-        with self._lock:
+        with self._count_lock:
             self._tx_count += 1
-
-            msg = ProtocolMessage(
-                timestamp=datetime.now().isoformat(timespec='milliseconds'),
-                direction="TX",
-                raw_hex=data.hex().upper(),
-                raw_bytes=list(data),
-                decoded=self._decode_command(data, cmd, value)
-            )
-
-            self._messages.append(msg)
+        # bytes() snapshots reusable TX buffers (no copy for bytes input)
+        self._messages.append((self._now_iso(), "TX", bytes(data), cmd, value))
 
     def log_rx(self, data: bytes) -> None:
         """
@@ -96,48 +174,12 @@ class ProtocolLogger:
         if not self._enabled:
             return
 
-        with self._lock:
+        is_error = _is_rx_error(data)
+        with self._count_lock:
             self._rx_count += 1
-
-            decoded = None
-            error = None
-
-            if len(data) >= 9:
-                try:
-                    parsed = parse_response(data)
-                    decoded = {
-                        "cmd": parsed.get("cmd", "??"),
-                        "value": parsed.get("value", 0),
-                        "checksum_valid": parsed.get("checksum_valid", False),
-                        "checksum_expected": parsed.get("checksum_expected"),
-                        "checksum_received": parsed.get("checksum_received"),
-                    }
-                    if not decoded["checksum_valid"]:
-                        self._error_count += 1
-                        error = f"Checksum mismatch: expected {decoded['checksum_expected']}, got {decoded['checksum_received']}"
-                except Exception as e:
-                    error = str(e)
-                    self._error_count += 1
-            elif len(data) > 0:
-                # Partial or async data
-                decoded = {
-                    "type": "async",
-                    "chars": "".join(chr(b) if 32 <= b < 127 else f"[{b:02X}]" for b in data)
-                }
-            else:
-                error = "Empty response (timeout?)"
+            if is_error:
                 self._error_count += 1
-
-            msg = ProtocolMessage(
-                timestamp=datetime.now().isoformat(timespec='milliseconds'),
-                direction="RX",
-                raw_hex=data.hex().upper() if data else "",
-                raw_bytes=list(data) if data else [],
-                decoded=decoded,
-                error=error
-            )
-
-            self._messages.append(msg)
+        self._messages.append((self._now_iso(), "RX", data, None, None))
 
     def log_error(self, error_msg: str, data: bytes = None) -> None:
         """
@@ -150,18 +192,70 @@ class ProtocolLogger:
         if not self._enabled:
             return
 
-        with self._lock:
+        with self._count_lock:
             self._error_count += 1
+        self._messages.append((self._now_iso(), "ERR", data or b"", None, error_msg))
+
+    def _materialize(self, record: tuple) -> ProtocolMessage:
+        """Build a ProtocolMessage from a raw log record (decoding on read)."""
+        timestamp, direction, data, cmd, extra = record
+
+        if direction == "TX":
+            return ProtocolMessage(
+                timestamp=timestamp,
+                direction="TX",
+                raw_bytes=data,
+                decoded=self._decode_command(data, cmd, extra)
+            )
 
-            msg = ProtocolMessage(
-                timestamp=datetime.now().isoformat(timespec='milliseconds'),
+        if direction == "ERR":
+            return ProtocolMessage(
+                timestamp=timestamp,
                 direction="ERR",
-                raw_hex=data.hex().upper() if data else "",
-                raw_bytes=list(data) if data else [],
-                error=error_msg
+                raw_bytes=data,
+                error=extra
             )
 
-            self._messages.append(msg)
+        decoded = None
+        error = None
+
+        if len(data) >= 9 and data.strip(b"IO"):
+            try:
+                parsed = parse_response(data)
+                decoded = {
+                    "cmd": parsed.get("cmd", "??"),
+                    "value": parsed.get("value", 0),
+                    "checksum_valid": parsed.get("checksum_valid", False),
+                    "checksum_expected": parsed.get("checksum_expected"),
+                    "checksum_received": parsed.get("checksum_received"),
+                }
+                if not decoded["checksum_valid"]:
+                    error = f"Checksum mismatch: expected {decoded['checksum_expected']}, got {decoded['checksum_received']}"
+            except Exception as e:
+                error = str(e)
+        elif len(data) > 0:
+            # Partial or async data (fast path when every byte is printable)
+            if not data.translate(None, _PRINTABLE_ASCII):
+                chars = data.decode("ascii")
+            elif not data.translate(None, _NON_PRINTABLE_ASCII):
+                # Nothing printable: bracket every byte in one hex pass
+                chars = "[" + data.hex("|").upper().replace("|", "][") + "]"
+            else:
+                chars = "".join(chr(b) if 32 <= b < 127 else f"[{b:02X}]" for b in data)
+            decoded = {
+                "type": "async",
+                "chars": chars
+            }
+        else:
+            error = "Empty response (timeout?)"
+
+        return ProtocolMessage(
+            timestamp=timestamp,
+            direction="RX",
+            raw_bytes=data,
+            decoded=decoded,
+            error=error
+        )
 
     def _decode_command(self, data: bytes, cmd: str = None, value: int = None) -> Dict[str, Any]:
         """Decode a command packet."""
@@ -199,30 +293,8 @@ class ProtocolLogger:
 
     def _get_command_description(self, cmd: str, value: int) -> str:
         """Get human-readable description of command."""
-        descriptions = {
-            "FV": "Get Version",
-            "FG": f"Move to {value}" if value > 0 else "Query Position",
-            "FD": f"Position: {value}",
-            "FT": "Get Temperature",
-            "FQ": "Halt Movement",
-            "FB": self._describe_backlash(value),
-            "FL": f"Max Travel: {value}" if value > 0 else "Query Max Travel",
-            "FC": "Motor Config",
-            "FP": "Power Switches",
-            "FS": f"Sync Position to {value}",
-            "FI": f"Move Inward {value} steps",
-            "FO": f"Move Outward {value} steps",
-        }
-        return descriptions.get(cmd, f"Unknown command")
-
-    def _describe_backlash(self, value: int) -> str:
-        """Describe backlash command value."""
-        if value == 0:
-            return "Query Backlash"
-        direction = value // 100000
-        amount = value % 100000
-        dir_str = "IN" if direction == 2 else "OUT" if direction == 3 else "OFF"
-        return f"Set Backlash: {amount} steps on {dir_str} motion"
+        describe = _COMMAND_DESCRIBERS.get(cmd)
+        return describe(value) if describe else "Unknown command"
 
     def get_messages(self, limit: int = 100, offset: int = 0) -> List[dict]:
         """
@@ -235,42 +307,41 @@ class ProtocolLogger:
         Returns:
             List of message dictionaries, oldest first (chronological order).
         """
-        with self._lock:
-            messages = list(self._messages)
-            # Keep chronological order (oldest first, newest last)
-            # Take the last 'limit' messages
-            if len(messages) > limit:
-                messages = messages[-limit:]
-            return [m.to_dict() for m in messages]
+        # Take the last 'limit' messages without copying the whole buffer
+        messages = list(islice(reversed(self._messages), limit))
+        # Keep chronological order (oldest first, newest last)
+        messages.reverse()
+        return [self._materialize(m).to_dict() for m in messages]
 
     def get_stats(self) -> dict:
-        """Get logging statistics."""
-        with self._lock:
-            return {
-                "total_messages": len(self._messages),
-                "tx_count": self._tx_count,
-                "rx_count": self._rx_count,
-                "error_count": self._error_count,
-                "max_messages": self._messages.maxlen,
-                "enabled": self._enabled,
-            }
+        """
+        Get logging statistics.
+
+        Lock-free snapshot: counts may trail concurrent logging by a message
+        or two.
+        """
+        return {
+            "total_messages": len(self._messages),
+            "tx_count": self._tx_count,
+            "rx_count": self._rx_count,
+            "error_count": self._error_count,
+            "max_messages": self._messages.maxlen,
+            "enabled": self._enabled,
+        }
 
     def clear(self) -> None:
         """Clear all logged messages."""
-        with self._lock:
-            self._messages.clear()
+        self._messages.clear()
+        with self._count_lock:
             self._tx_count = 0
             self._rx_count = 0
             self._error_count = 0
 
 
-# Global instance
-_logger: Optional[ProtocolLogger] = None
+# Global instance (created at import, so there is no lazy-init race)
+_logger: ProtocolLogger = ProtocolLogger()
 
 
 def get_protocol_logger() -> ProtocolLogger:
-    """Get or create the global protocol logger."""
-    global _logger
-    if _logger is None:
-        _logger = ProtocolLogger()
+    """Get the global protocol logger."""
     return _logger
@@ -5,23 +5,45 @@ Provides utilities to list available serial ports and automatically
 detect Robofocus devices by probing with FV command.
 """
 
+import errno
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import serial
 import serial.tools.list_ports
 from serial import SerialException
 
-from robofocus_alpaca.protocol.encoder import encode_command, parse_response
-from robofocus_alpaca.protocol.checksum import validate_checksum
+from robofocus_alpaca.protocol.encoder import encode_command
 
 
 logger = logging.getLogger(__name__)
 
+# errno values meaning "port held by another process"
+_BUSY_ERRNOS = (errno.EACCES, errno.EBUSY)
 
-@dataclass
+# Max gap between bytes of a probe response (seconds)
+PROBE_INTER_BYTE_TIMEOUT = 0.05
+
+# How long a comports() listing is reused (seconds)
+PORTS_CACHE_TTL = 1.0
+
+# include_bluetooth -> (time.monotonic() of listing, ports)
+_ports_cache: Dict[bool, Tuple[float, List["PortInfo"]]] = {}
+
+# How long a port that answered as another device is left out of scans (seconds)
+BAD_PORT_RETRY_SECONDS = 30.0
+
+# Bytes a Robofocus may send first: a packet, or step chars while moving
+_ROBOFOCUS_FIRST_BYTES = (b"F", b"I", b"O")
+
+# (port name, hardware id) -> time.monotonic() of last non-Robofocus reply
+_bad_ports: Dict[Tuple[str, str], float] = {}
+
+
+@dataclass(frozen=True)
 class PortInfo:
     """Information about an available serial port."""
 
@@ -40,7 +62,7 @@ class PortInfo:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class DiscoveredDevice:
     """Information about a discovered Robofocus device."""
 
@@ -61,20 +83,26 @@ def list_available_ports(include_bluetooth: bool = True) -> List[PortInfo]:
     """
     List all available serial (COM) ports on the system.
 
+    Enumeration is slow (registry / sysfs), so a listing is reused for
+    PORTS_CACHE_TTL seconds. Call invalidate_ports_cache() to force a rescan.
+
     Args:
         include_bluetooth: If False, filter out Bluetooth virtual ports.
 
     Returns:
         List of PortInfo objects with port metadata.
     """
+    now = time.monotonic()
+    cached = _ports_cache.get(include_bluetooth)
+    if cached and now - cached[0] < PORTS_CACHE_TTL:
+        return list(cached[1])
+
     ports = []
 
     for port in serial.tools.list_ports.comports():
         # Check if it's a Bluetooth port
-        is_bluetooth = False
-        desc_lower = (port.description or "").lower()
-        if "bluetooth" in desc_lower or "bth" in desc_lower:
-            is_bluetooth = True
+        desc_folded = (port.description or "").casefold()
+        is_bluetooth = "bluetooth" in desc_folded or "bth" in desc_folded
 
         if not include_bluetooth and is_bluetooth:
             continue
@@ -92,24 +120,63 @@ def list_available_ports(include_bluetooth: bool = True) -> List[PortInfo]:
     ports.sort(key=lambda p: p.name)
 
     logger.debug(f"Found {len(ports)} serial ports")
-    return ports
+    _ports_cache[include_bluetooth] = (now, ports)
+    return list(ports)
+
+
+def invalidate_ports_cache() -> None:
+    """Discard cached port listings so the next call re-enumerates."""
+    _ports_cache.clear()
+
+
+def _parse_fv_response(response: bytes) -> Optional[str]:
+    """
+    Validate a 9-byte FV response and extract the firmware version.
+
+    Minimal single-purpose parser for probing: no dict is built and the
+    checksum is checked inline.
+
+    Args:
+        response: Raw 9-byte packet.
+
+    Returns:
+        Firmware version string, or None if the packet is not a valid FV reply.
+    """
+    if response[:2] != b"FV" or (sum(response[:8]) & 0xFF) != response[8]:
+        return None
+
+    # Handle both integer (002100) and float (3.2) firmware versions
+    value_bytes = response[2:8]
+    try:
+        if b"." in value_bytes:
+            return str(float(value_bytes))
+        return f"{int(value_bytes):06d}"
+    except ValueError:
+        return None
 
 
 def scan_for_robofocus(
     timeout_seconds: float = 1.0,
     skip_ports: Optional[List[str]] = None,
     include_bluetooth: bool = False,
+    stop_on_first: bool = False,
+    fresh: bool = False,
 ) -> List[DiscoveredDevice]:
     """
     Scan all available COM ports to find Robofocus devices.
 
     Probes each port by sending FV command and validating the response.
-    Uses short timeout for fast scanning.
+    Ports are probed concurrently, so the scan takes about one timeout
+    regardless of how many ports exist.
 
     Args:
         timeout_seconds: Timeout per port (default 1.0s for fast scan).
         skip_ports: List of port names to skip (e.g., already in use).
         include_bluetooth: If True, also scan Bluetooth ports.
+        stop_on_first: If True, return as soon as one device is found;
+            probes not yet started are cancelled.
+        fresh: If True, also re-probe ports that recently answered as
+            another device (for an explicit user rescan).
 
     Returns:
         List of discovered Robofocus devices with port and firmware info.
@@ -117,11 +184,16 @@ def scan_for_robofocus(
     skip_ports = skip_ports or []
     discovered = []
 
+    if fresh:
+        _bad_ports.clear()
+
     ports = list_available_ports(include_bluetooth=include_bluetooth)
     logger.info(f"Scanning {len(ports)} ports for Robofocus devices...")
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    now = time.monotonic()
 
+    to_probe = []
     for port_info in ports:
         port_name = port_info.name
 
@@ -135,12 +207,41 @@ def scan_for_robofocus(
             logger.debug(f"Skipping {port_name}: Bluetooth port")
             continue
 
-        # Try to probe this port
-        device = _probe_port(port_name, port_info.description, timeout_seconds)
-        if device:
-            discovered.append(device)
+        # Skip ports that answered as another device recently
+        failed_at = _bad_ports.get((port_name, port_info.hardware_id))
+        if failed_at is not None and now - failed_at < BAD_PORT_RETRY_SECONDS:
+            logger.debug(f"Skipping {port_name}: not a Robofocus {now - failed_at:.0f}s ago")
+            continue
 
-    elapsed_ms = int((time.time() - start_time) * 1000)
+        to_probe.append(port_info)
+
+    # Probe ports in parallel (each probe is independent blocking I/O)
+    if to_probe:
+        executor = ThreadPoolExecutor(max_workers=min(16, len(to_probe)))
+        try:
+            futures = {
+                executor.submit(_probe_port, p.name, p.description, timeout_seconds): p
+                for p in to_probe
+            }
+            for future in as_completed(futures):
+                device, foreign = future.result()
+                port_info = futures[future]
+                if device:
+                    _bad_ports.pop((port_info.name, port_info.hardware_id), None)
+                    discovered.append(device)
+                    if stop_on_first:
+                        break
+                elif foreign:
+                    # Busy, silent or timed-out ports are retried next scan
+                    _bad_ports[(port_info.name, port_info.hardware_id)] = time.monotonic()
+        finally:
+            # In-flight probes finish on their own timeout and close their port
+            executor.shutdown(wait=not stop_on_first, cancel_futures=True)
+
+    # Keep deterministic order regardless of completion order
+    discovered.sort(key=lambda d: d.port)
+
+    elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
     logger.info(f"Scan complete: found {len(discovered)} Robofocus device(s) in {elapsed_ms}ms")
 
     if not discovered:
@@ -149,7 +250,9 @@ def scan_for_robofocus(
     return discovered
 
 
-def _probe_port(port_name: str, description: str, timeout: float) -> Optional[DiscoveredDevice]:
+def _probe_port(
+    port_name: str, description: str, timeout: float
+) -> Tuple[Optional[DiscoveredDevice], bool]:
     """
     Probe a single port to check if it's a Robofocus device.
 
@@ -159,7 +262,9 @@ def _probe_port(port_name: str, description: str, timeout: float) -> Optional[Di
         timeout: Read timeout in seconds.
 
     Returns:
-        DiscoveredDevice if Robofocus found, None otherwise.
+        (device, foreign): device is the DiscoveredDevice if a Robofocus was
+        found; foreign is True only if the port gave a definite
+        non-Robofocus reply (not for busy, silent or failing ports).
     """
     logger.debug(f"Probing {port_name} ({description})...")
 
@@ -174,6 +279,7 @@ def _probe_port(port_name: str, description: str, timeout: float) -> Optional[Di
             stopbits=serial.STOPBITS_ONE,
             timeout=timeout,
             write_timeout=timeout,
+            inter_byte_timeout=PROBE_INTER_BYTE_TIMEOUT,
         )
 
         # Flush buffers
@@ -185,56 +291,58 @@ def _probe_port(port_name: str, description: str, timeout: float) -> Optional[Di
         port.write(fv_packet)
         port.flush()
 
-        # Read response
-        response = port.read(9)
+        # Read response; every Robofocus packet starts with 'F', so reject
+        # other devices on the first byte instead of waiting for nine
+        first = port.read(1)
+        if first != b"F":
+            logger.debug(f"{port_name}: No valid response (first byte {first!r})")
+            return None, bool(first) and first not in _ROBOFOCUS_FIRST_BYTES
+
+        response = first + port.read(8)
 
         if len(response) != 9:
             logger.debug(f"{port_name}: No valid response (got {len(response)} bytes)")
-            return None
+            return None, False
 
-        # Validate checksum
-        if not validate_checksum(response):
-            logger.debug(f"{port_name}: Invalid checksum")
-            return None
+        firmware = _parse_fv_response(response)
+        if firmware is None:
+            logger.debug(f"{port_name}: Not a valid FV response: {response.hex()}")
+            return None, False
 
-        # Parse response
-        parsed = parse_response(response)
-
-        if parsed["cmd"] != "FV":
-            logger.debug(f"{port_name}: Unexpected command in response: {parsed['cmd']}")
-            return None
-
-        # Handle both integer (002100) and float (3.2) firmware versions
-        fw_value = parsed['value']
-        if isinstance(fw_value, float):
-            firmware = str(fw_value)
-        else:
-            firmware = f"{fw_value:06d}"
         logger.info(f"Found Robofocus on {port_name} (firmware: {firmware})")
 
         return DiscoveredDevice(
             port=port_name,
             firmware_version=firmware,
             description=description,
-        )
+        ), False
 
     except SerialException as e:
-        error_msg = str(e).lower()
-        if "access" in error_msg or "permission" in error_msg or "in use" in error_msg:
+        if _is_port_busy(e):
             logger.debug(f"Skipping {port_name}: port in use")
         else:
             logger.debug(f"Skipping {port_name}: {e}")
-        return None
+        return None, False
 
     except Exception as e:
         logger.debug(f"Error probing {port_name}: {e}")
-        return None
+        return None, False
 
     finally:
         if port and port.is_open:
             port.close()
 
 
+def _is_port_busy(error: SerialException) -> bool:
+    """Check whether an open failure means the port is in use / access denied."""
+    # POSIX: pyserial sets errno from the failing open()
+    if error.errno is not None:
+        return error.errno in _BUSY_ERRNOS
+    # Windows: only the message carries the reason
+    error_msg = str(error).lower()
+    return "access" in error_msg or "permission" in error_msg or "in use" in error_msg
+
+
 def find_first_robofocus(
     timeout_seconds: float = 1.0,
     skip_ports: Optional[List[str]] = None,
@@ -243,6 +351,7 @@ def find_first_robofocus(
     Find the first available Robofocus device.
 
     Convenience function that returns the first device found, or None.
+    Stops scanning as soon as any port answers.
 
     Args:
         timeout_seconds: Timeout per port.
@@ -254,11 +363,7 @@ def find_first_robofocus(
     devices = scan_for_robofocus(
         timeout_seconds=timeout_seconds,
         skip_ports=skip_ports,
+        stop_on_first=True,
     )
 
-    if devices:
-        if len(devices) > 1:
-            logger.warning(f"Multiple Robofocus devices found, using first one: {devices[0].port}")
-        return devices[0]
-
-    return None
+    return devices[0] if devices else None
@@ -5,22 +5,33 @@ Implements SerialProtocolInterface using pyserial for RS-232 communication.
 
 Architecture aligned with INDI driver (robofocus.cpp):
 - NEVER send commands during movement (any serial activity stops the hardware!)
-- Read one byte at a time for async chars (I/O/F)
+- Read async chars (I/O/F) as they arrive, draining bursts in one call
 - Buffer flush ONLY after complete response
 """
 
 import logging
+import os
+import random
+import sys
 import threading
 import time
-from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None
 
 import serial
 from serial import SerialException
 
-from robofocus_alpaca.protocol.interface import SerialProtocolInterface
-from robofocus_alpaca.protocol.encoder import encode_command, parse_response
-from robofocus_alpaca.protocol.checksum import validate_checksum
+from robofocus_alpaca.protocol.interface import SerialProtocolInterface, HardwareSettings
+from robofocus_alpaca.protocol.encoder import (
+    encode_command,
+    encode_into,
+    get_zero_packet,
+    parse_response,
+)
 from robofocus_alpaca.protocol.logger import get_protocol_logger
 from robofocus_alpaca.config.models import SerialConfig
 from robofocus_alpaca.utils.exceptions import (
@@ -38,12 +49,29 @@ from robofocus_alpaca.utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Async status bytes sent by the hardware during movement
+CHAR_I = ord("I")  # One step inward
+CHAR_O = ord("O")  # One step outward
+CHAR_F = ord("F")  # Start of a response packet
+
 
-class MovementState(Enum):
-    """Movement state machine aligned with INDI driver."""
-    IDLE = "idle"
-    MOVING_PROGRAMMATIC = "programmatic"  # Started by move_absolute()
-    MOVING_EXTERNAL = "external"          # Started by handset (pulsantiera)
+# Movement state machine aligned with INDI driver. Plain ints: the state is
+# checked on every command, and int compares are cheaper than Enum members.
+IDLE = 0
+MOVING_PROGRAMMATIC = 1  # Started by move_absolute()
+MOVING_EXTERNAL = 2      # Started by handset (pulsantiera)
+
+_STATE_NAMES = {IDLE: "idle", MOVING_PROGRAMMATIC: "programmatic", MOVING_EXTERNAL: "external"}
+
+# Reply command expected for the queries this driver sends. Commands not
+# listed (FS, FI, FO, FQ) vary by firmware and accept any packet.
+_REPLY_CMD = {
+    "FG": "FD",
+    "FV": "FV",
+    "FT": "FT",
+    "FB": "FB",
+    "FL": "FL",
+}
 
 
 class RobofocusSerial(SerialProtocolInterface):
@@ -57,15 +85,57 @@ class RobofocusSerial(SerialProtocolInterface):
     any serial activity as an immediate stop command.
     """
 
+    __slots__ = (
+        "_config",
+        "_port",
+        "_serial_lock",
+        "_write_lock",
+        "_movement_reader",
+        "_connected",
+        "_firmware_version",
+        "_tx_buffer",
+        "_rx_buffer",
+        "_last_rx",
+        "_needs_flush",
+        "_pipelining_failed",
+        "_consecutive_failures",
+        "_circuit_open_until",
+        "_movement_state",
+        "_idle_event",
+        "_external_monitor_thread",
+        "_position",
+        "_position_time",
+        "_target_position",
+        "_temperature_cache",
+        "_temperature_cache_expiry",
+        "_temperature_cache_max_age",
+    )
+
     # Serial port settings (fixed by Robofocus protocol)
     BAUD_RATE = 9600
     DATA_BITS = 8
     PARITY = serial.PARITY_NONE
     STOP_BITS = serial.STOPBITS_ONE
 
-    # Retry settings
+    # Retry settings (capped exponential backoff with full jitter)
     MAX_RETRIES = 3
-    RETRY_DELAY_MS = 500
+    RETRY_BASE_MS = 50
+    RETRY_MAX_MS = 500
+
+    # Circuit breaker: after this many commands in a row exhaust their
+    # retries, fail fast for CIRCUIT_COOLDOWN_SECONDS instead of retrying
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_COOLDOWN_SECONDS = 5.0
+
+    # How long an idle FG reading is reused before querying again (seconds)
+    POSITION_CACHE_TTL = 0.05
+
+    # Per-reply timeout for pipelined batches (seconds). A reply takes ~10 ms
+    # at 9600 baud; firmware that drops queued input is detected quickly.
+    BATCH_TIMEOUT_SECONDS = 0.5
+
+    # Stray packets _read_response drops before giving up on an exchange
+    MAX_STRAY_PACKETS = 3
 
     def __init__(self, config: SerialConfig):
         """
@@ -76,18 +146,42 @@ class RobofocusSerial(SerialProtocolInterface):
         """
         self._config = config
         self._port: Optional[serial.Serial] = None
+        # _serial_lock owns the port for a whole exchange (and for readers
+        # waiting out a movement); _write_lock only serializes writes, so
+        # halt() can reach the hardware while a reader holds _serial_lock.
+        # Lock order: _serial_lock, then _write_lock.
         self._serial_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # True while wait_for_movement_end or the external monitor holds
+        # _serial_lock; only then may halt() bypass it
+        self._movement_reader = False
         self._connected = False
         self._firmware_version: Optional[str] = None
+        self._tx_buffer = bytearray(9)
+        # Bytes already read from the port but not yet consumed
+        self._rx_buffer = bytearray()
+        # Set after a failed exchange: stale input must go before the next one
+        self._needs_flush = False
+        # Set once a pipelined batch timed out (firmware drops queued input);
+        # kept across reconnects so later batches go one at a time directly
+        self._pipelining_failed = False
+        self._consecutive_failures = 0
+        self._circuit_open_until: float = 0.0  # time.monotonic()
+        # Last packet parsed by _complete_packet and its parse result
+        self._last_rx: Tuple[Optional[bytes], Optional[dict]] = (None, None)
 
         # Movement state machine (aligned with INDI)
-        self._movement_state = MovementState.IDLE
+        self._movement_state = IDLE
+        self._idle_event = threading.Event()  # Set while _movement_state is IDLE
+        self._idle_event.set()
+        self._external_monitor_thread: Optional[threading.Thread] = None
         self._position = 0
+        self._position_time: float = 0.0  # time.monotonic() of last idle FG reading
         self._target_position = 0
 
         # Cached temperature (updated when idle, max age 120s)
         self._temperature_cache: Optional[float] = None
-        self._temperature_cache_time: float = 0
+        self._temperature_cache_expiry: float = 0.0  # time.monotonic()
         self._temperature_cache_max_age: float = 120.0  # seconds
 
     def connect(self) -> None:
@@ -120,14 +214,17 @@ class RobofocusSerial(SerialProtocolInterface):
             else:
                 raise PortNotFoundError(f"Failed to open {port_name}: {e}")
 
+        # Deliver each received byte immediately (I/O/F chars during movement)
+        self._enable_low_latency()
+
         # Flush buffers
-        self._port.reset_input_buffer()
-        self._port.reset_output_buffer()
+        self._flush_both()
 
         # Perform FV handshake to validate hardware
         try:
-            response = self._send_command_internal("FV", 0)
-            parsed = parse_response(response)
+            with self._serial_lock:
+                response = self._send_command_internal("FV", 0)
+            parsed = self._parse(response)
 
             if not parsed["checksum_valid"]:
                 self._port.close()
@@ -140,10 +237,13 @@ class RobofocusSerial(SerialProtocolInterface):
             else:
                 self._firmware_version = f"{fw_value:06d}"
             self._connected = True
+            self._consecutive_failures = 0
+            self._circuit_open_until = 0.0
 
             # Query initial position
-            pos_response = self._send_command_internal("FG", 0)
-            pos_parsed = parse_response(pos_response)
+            with self._serial_lock:
+                pos_response = self._send_command_internal("FG", 0)
+            pos_parsed = self._parse(pos_response)
             if pos_parsed["checksum_valid"] and pos_parsed["cmd"] == "FD":
                 self._position = int(pos_parsed["value"])
                 self._target_position = self._position
@@ -155,15 +255,61 @@ class RobofocusSerial(SerialProtocolInterface):
                 self._port.close()
             raise HandshakeError(f"Hardware did not respond to FV command: {e}")
 
+    def _enable_low_latency(self) -> None:
+        """
+        Put the port in low-latency mode where the platform supports it.
+
+        On Linux this sets ASYNC_LOW_LATENCY via TIOCSSERIAL (pyserial's
+        set_low_latency_mode), so USB-serial adapters hand each byte to
+        userspace immediately instead of bundling them, and lowers the FTDI
+        latency timer (default 16 ms) to 1 ms. Best effort only; disabled
+        by serial.low_latency = false.
+        """
+        if not self._config.low_latency:
+            return
+
+        set_low_latency_mode = getattr(self._port, "set_low_latency_mode", None)
+        if set_low_latency_mode is not None:
+            try:
+                set_low_latency_mode(True)
+                logger.debug("Serial low-latency mode enabled")
+            except (OSError, ValueError) as e:
+                logger.debug(f"Serial low-latency mode not available: {e}")
+
+        if sys.platform.startswith("linux"):
+            self._set_ftdi_latency_timer(1)
+
+    def _set_ftdi_latency_timer(self, ms: int) -> None:
+        """
+        Set the USB-serial latency timer via sysfs (Linux, FTDI-style adapters).
+
+        Usually needs write permission on the sysfs node (udev rule or root);
+        failures are logged and ignored.
+
+        Args:
+            ms: Latency timer in milliseconds (1-255).
+        """
+        tty = os.path.basename(os.path.realpath(self._config.port))
+        path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+        try:
+            with open(path, "w") as f:
+                f.write(str(ms))
+            logger.debug(f"Set {tty} latency_timer to {ms} ms")
+        except OSError as e:
+            logger.debug(f"Could not set latency_timer for {tty}: {e}")
+
     def disconnect(self) -> None:
         """Close serial port connection."""
         if self._port and self._port.is_open:
+            # Writes are not drained individually; let a pending FQ go out
+            with self._write_lock:
+                self._port.flush()
             self._port.close()
             logger.info("Serial port closed")
 
         self._connected = False
         self._port = None
-        self._movement_state = MovementState.IDLE
+        self._set_movement_state(IDLE)
 
     def is_connected(self) -> bool:
         """Check if connected to hardware."""
@@ -184,83 +330,306 @@ class RobofocusSerial(SerialProtocolInterface):
 
         # Block commands during PROGRAMMATIC movement (CRITICAL for hardware safety)
         # During EXTERNAL movement, allow FG queries to detect when movement ends
-        if self._movement_state == MovementState.MOVING_PROGRAMMATIC:
+        if self._movement_state == MOVING_PROGRAMMATIC:
             raise MovementInProgressError(
                 f"Cannot send {cmd} command during programmatic movement"
             )
-        if self._movement_state == MovementState.MOVING_EXTERNAL and cmd not in ("FG", "FQ"):
+        if self._movement_state == MOVING_EXTERNAL and cmd not in ("FG", "FQ"):
             raise MovementInProgressError(
                 f"Cannot send {cmd} command during external movement (only FG/FQ allowed)"
             )
 
+        if self._circuit_open_until and time.monotonic() < self._circuit_open_until:
+            raise MaxRetriesExceededError(
+                f"{cmd} command not sent: link failing, retrying after cooldown"
+            )
+
         last_exception = None
 
-        for attempt in range(1, self.MAX_RETRIES + 1):
-            try:
-                result = self._send_command_internal(cmd, value)
-                # If None, external movement detected - return None (not an error)
-                if result is None:
-                    return None
-                return result
-            except (SerialTimeoutError, ChecksumMismatchError) as e:
-                last_exception = e
-                if attempt < self.MAX_RETRIES:
-                    logger.warning(f"Command {cmd} retry: attempt {attempt}/{self.MAX_RETRIES}")
-                    time.sleep(self.RETRY_DELAY_MS / 1000.0)
-                    # Flush buffers before retry
-                    if self._port:
-                        self._port.reset_input_buffer()
-                        self._port.reset_output_buffer()
+        # Hold the port for the whole exchange, retries included
+        with self._serial_lock:
+            for attempt in range(1, self.MAX_RETRIES + 1):
+                try:
+                    result = self._send_command_internal(cmd, value)
+                    self._consecutive_failures = 0
+                    self._circuit_open_until = 0.0
+                    # If None, external movement detected - return None (not an error)
+                    if result is None:
+                        return None
+                    return result
+                except (SerialTimeoutError, ChecksumMismatchError) as e:
+                    last_exception = e
+                    if attempt < self.MAX_RETRIES:
+                        logger.warning(f"Command {cmd} retry: attempt {attempt}/{self.MAX_RETRIES}")
+                        backoff_ms = min(self.RETRY_MAX_MS, self.RETRY_BASE_MS * 2 ** (attempt - 1))
+                        time.sleep(random.uniform(0, backoff_ms) / 1000.0)
+                        # Input is flushed before the retry (_needs_flush)
+
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+                self._circuit_open_until = time.monotonic() + self.CIRCUIT_COOLDOWN_SECONDS
+                logger.warning(
+                    f"{self._consecutive_failures} commands failed in a row, "
+                    f"pausing commands for {self.CIRCUIT_COOLDOWN_SECONDS:.0f}s"
+                )
+                get_protocol_logger().log_error(
+                    f"Circuit open after {self._consecutive_failures} failed commands", b""
+                )
 
         raise MaxRetriesExceededError(f"{cmd} command failed after {self.MAX_RETRIES} attempts: {last_exception}")
 
     def _send_command_internal(self, cmd: str, value: int) -> bytes:
-        """Send command and read response (internal, no retry)."""
+        """
+        Send command and read response (internal, no retry).
+
+        Caller must hold _serial_lock.
+        """
         protocol_logger = get_protocol_logger()
 
-        with self._serial_lock:
-            if not self._port or not self._port.is_open:
-                raise NotConnectedError("Serial port not open")
+        if not self._port or not self._port.is_open:
+            raise NotConnectedError("Serial port not open")
 
-            # Only flush output buffer, NOT input buffer
-            # (input buffer is flushed AFTER receiving complete response)
-            self._port.reset_output_buffer()
+        # Encode and send command (queries use the pre-built packets)
+        packet = get_zero_packet(cmd) if value == 0 else encode_command(cmd, value)
 
-            # Encode and send command
-            packet = encode_command(cmd, value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX: %s", packet.hex(" ").upper())
 
-            if logger.isEnabledFor(logging.DEBUG):
-                hex_str = " ".join(f"{b:02X}" for b in packet)
-                logger.debug(f"TX: {hex_str}")
+        # Log TX to protocol logger
+        protocol_logger.log_tx(packet, cmd, value)
 
-            # Log TX to protocol logger
-            protocol_logger.log_tx(packet, cmd, value)
+        # Only a failed exchange leaves stale input behind; on the happy path
+        # no flush syscall is needed, and _read_response drops any stray
+        # packet whose command doesn't match the expected reply
+        if self._needs_flush:
+            self._flush_input()
+            self._needs_flush = False
 
+        # The output queue has drained by the time the previous response came
+        # back. No flush()/tcdrain: the response read below already waits for
+        # the hardware, which cannot answer before the packet is out.
+        with self._write_lock:
             self._port.write(packet)
-            self._port.flush()
 
-            # Read response
+        # Read response
+        try:
             response = self._read_response(cmd, protocol_logger)
+        except (SerialTimeoutError, ProtocolError):
+            self._needs_flush = True
+            raise
 
-            # If None, external movement is in progress - return None
-            # (state already set to MOVING_EXTERNAL by _read_response)
-            if response is None:
+        # If None, external movement is in progress - return None
+        # (state already set to MOVING_EXTERNAL by _read_response)
+        if response is None:
+            return None
+
+        # RX already logged (protocol logger and debug) by _read_response
+
+        # Validate checksum
+        if not self._parse(response)["checksum_valid"]:
+            self._needs_flush = True
+            raise ChecksumMismatchError(f"Checksum mismatch for {cmd} response")
+
+        return response
+
+    def send_commands_batch(self, cmds: List[Tuple[str, int]]) -> List[bytes]:
+        """
+        Send several commands back-to-back and read all responses.
+
+        All packets go out in a single write, then the responses are read
+        in order, so the batch costs one round-trip instead of one per
+        command. Replies are read with BATCH_TIMEOUT_SECONDS. If the pipelined
+        exchange fails, the commands are re-sent one at a time through
+        send_command (input flushed first); after a timeout, pipelining is
+        not tried again on this instance.
+
+        Raises:
+            MovementInProgressError: If movement is in progress.
+        """
+        if not self.is_connected():
+            raise NotConnectedError("Focuser not connected")
+
+        if self._movement_state != IDLE:
+            raise MovementInProgressError(
+                f"Cannot send batched commands during {_STATE_NAMES[self._movement_state]} movement"
+            )
+
+        if self._pipelining_failed:
+            return [self.send_command(cmd, value) for cmd, value in cmds]
+
+        if self._circuit_open_until and time.monotonic() < self._circuit_open_until:
+            raise MaxRetriesExceededError("Batched commands not sent: link failing, retrying after cooldown")
+
+        protocol_logger = get_protocol_logger()
+
+        try:
+            with self._serial_lock:
+                if not self._port or not self._port.is_open:
+                    raise NotConnectedError("Serial port not open")
+
+                packets = []
+                for cmd, value in cmds:
+                    packet = get_zero_packet(cmd) if value == 0 else encode_command(cmd, value)
+                    protocol_logger.log_tx(packet, cmd, value)
+                    packets.append(packet)
+
+                with self._write_lock:
+                    self._port.write(b"".join(packets))
+
+                responses = []
+                for i, (cmd, _) in enumerate(cmds):
+                    # Only flush the input buffer after the last response
+                    response = self._read_response(
+                        cmd, protocol_logger, flush=(i == len(cmds) - 1),
+                        timeout=self.BATCH_TIMEOUT_SECONDS
+                    )
+                    if response is None:
+                        raise MovementInProgressError("External movement detected during batch")
+                    if not self._parse(response)["checksum_valid"]:
+                        raise ChecksumMismatchError(f"Checksum mismatch for {cmd} response")
+                    responses.append(response)
+
+                self._consecutive_failures = 0
+                self._circuit_open_until = 0.0
+                return responses
+
+        except (SerialTimeoutError, ProtocolError) as e:
+            if isinstance(e, SerialTimeoutError):
+                self._pipelining_failed = True
+                logger.warning(f"Batched commands timed out ({e}), sending one at a time from now on")
+            else:
+                logger.warning(f"Batched commands failed ({e}), sending one at a time")
+            # Late replies to the batch are flushed before the first re-send,
+            # and _read_response drops any that arrive after that.
+            # send_command counts failures for the circuit breaker.
+            self._needs_flush = True
+            return [self.send_command(cmd, value) for cmd, value in cmds]
+
+    def _pull(self, want: int = 1) -> Optional[int]:
+        """
+        Return the next received byte, refilling the RX buffer when empty.
+
+        A refill blocks for the first byte (port timeout), and everything
+        else already waiting is drained by the same read call. With want > 1
+        the refill instead asks for that many bytes up front, so a whole
+        reply is collected by one read.
+
+        Args:
+            want: Bytes to request on refill (e.g. 9 for a full packet).
+
+        Returns:
+            Byte value, or None on read timeout.
+        """
+        buf = self._rx_buffer
+        if not buf:
+            size = want if want > 1 else max(1, self._port.in_waiting)
+            data = self._port.read(size)
+            if not data:
                 return None
+            buf += data
+        byte = buf[0]
+        del buf[0]
+        return byte
 
-            # Log RX to protocol logger (already logged in _read_response for 'F' packets)
-            # protocol_logger.log_rx(response)  # Don't double-log
+    def _pull_chunk(self) -> bytes:
+        """
+        Return all buffered bytes, or one fresh burst if the buffer is empty.
 
-            if logger.isEnabledFor(logging.DEBUG):
-                hex_str = " ".join(f"{b:02X}" for b in response)
-                logger.debug(f"RX: {hex_str}")
+        Returns:
+            Received bytes (empty on read timeout).
+        """
+        buf = self._rx_buffer
+        if buf:
+            data = bytes(buf)
+            buf.clear()
+            return data
+        return self._port.read(max(1, self._port.in_waiting))
+
+    def _take(self, n: int, head: bytes = b"") -> bytes:
+        """
+        Consume up to n bytes: buffered ones first, then a single read.
+
+        The result is built straight from a view of the RX buffer, so
+        prefixing head costs no extra copy.
+
+        Args:
+            n: Number of bytes to consume.
+            head: Bytes to prepend (e.g. the 'F' already pulled).
 
-            # Validate checksum
-            if not validate_checksum(response):
-                raise ChecksumMismatchError(f"Checksum mismatch for {cmd} response")
+        Returns:
+            head + up to n bytes (fewer on read timeout).
+        """
+        buf = self._rx_buffer
+        if len(buf) < n:
+            buf += self._port.read(n - len(buf))
+        with memoryview(buf) as view:
+            data = head + view[:n]
+        del buf[:n]
+        return data
+
+    def _flush_input(self) -> None:
+        """Discard buffered and pending input."""
+        self._rx_buffer.clear()
+        self._port.reset_input_buffer()
 
-            return response
+    def _flush_both(self) -> None:
+        """
+        Discard pending input and output.
 
-    def _read_response(self, cmd: str, protocol_logger) -> bytes:
+        On POSIX both queues go in a single tcflush(TCIOFLUSH) call;
+        elsewhere this falls back to pyserial's two reset calls.
+        """
+        self._rx_buffer.clear()
+        fd = getattr(self._port, "fd", None)
+        if termios is not None and fd is not None:
+            termios.tcflush(fd, termios.TCIOFLUSH)
+        else:
+            self._port.reset_input_buffer()
+            self._port.reset_output_buffer()
+
+    def _complete_packet(self, head: bytes, protocol_logger) -> Tuple[bytes, Optional[dict]]:
+        """
+        Read the rest of a 9-byte packet whose first byte(s) are already in hand.
+
+        Shared by every reader: logs the packet and publishes the position
+        when it is a valid FD. Movement state and flushing stay with the caller.
+
+        Args:
+            head: Bytes received so far, starting with 'F'.
+            protocol_logger: Protocol logger for logging
+
+        Returns:
+            (packet, parsed) - parsed is None if the packet is incomplete.
+        """
+        packet = self._take(9 - len(head), head)
+        if len(packet) < 9:
+            return packet, None
+
+        protocol_logger.log_rx(packet)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RX: %s", packet.hex(" ").upper())
+
+        parsed = parse_response(packet)
+        self._last_rx = (packet, parsed)
+        if parsed["cmd"] == "FD" and parsed["checksum_valid"]:
+            self._position = int(parsed["value"])
+        return packet, parsed
+
+    def _parse(self, packet: bytes) -> dict:
+        """
+        Parse a response packet, reusing the result from _complete_packet.
+
+        Every response is parsed once when it is read; callers that look at
+        it again get that same dict back instead of decoding it twice.
+        """
+        last_packet, last_parsed = self._last_rx
+        if packet is last_packet:
+            return last_parsed
+        return parse_response(packet)
+
+    def _read_response(
+        self, cmd: str, protocol_logger, flush: bool = True, timeout: Optional[float] = None
+    ) -> bytes:
         """
         Read 9-byte response packet with immediate external movement detection.
 
@@ -272,6 +641,14 @@ class RobofocusSerial(SerialProtocolInterface):
         Args:
             cmd: Command being executed (for error messages)
             protocol_logger: Protocol logger for logging
+            flush: Drop buffered bytes after the packet (False while more
+                pipelined responses are still expected)
+            timeout: Read timeout in seconds (default: config timeout_seconds)
+
+        A complete packet that is not the reply to cmd (e.g. a late answer
+        to an earlier command) is dropped and reading continues; the input
+        is then flushed before the next exchange. More than MAX_STRAY_PACKETS
+        strays in one exchange raise ProtocolError.
 
         Returns:
             9-byte response packet starting with 'F', or None if external movement detected
@@ -281,15 +658,22 @@ class RobofocusSerial(SerialProtocolInterface):
             ProtocolError: When invalid data received
         """
         original_timeout = self._port.timeout
-        self._port.timeout = self._config.timeout_seconds
+        self._port.timeout = self._config.timeout_seconds if timeout is None else timeout
+
+        # Fast path: a reply is normally exactly 9 bytes, so the first refill
+        # asks for all of them and _complete_packet finds the rest buffered
+        want = 9
+        expected = _REPLY_CMD.get(cmd)
+        strays = 0
 
         try:
             while True:
-                byte_data = self._port.read(1)
+                byte = self._pull(want)
+                want = 1
 
-                if len(byte_data) == 0:
+                if byte is None:
                     # Timeout - no data
-                    if self._movement_state == MovementState.MOVING_EXTERNAL:
+                    if self._movement_state == MOVING_EXTERNAL:
                         # We're in external movement mode but no data - maybe user released
                         # Keep state and return None, next poll will check again
                         return None
@@ -297,60 +681,57 @@ class RobofocusSerial(SerialProtocolInterface):
                         protocol_logger.log_error(f"Timeout: no response to {cmd}", b"")
                         raise SerialTimeoutError(f"No response to {cmd} command")
 
-                char = chr(byte_data[0])
-
-                if char == 'I':  # Inward movement
+                byte_data = bytes((byte,))
+                if byte == CHAR_I or byte == CHAR_O:  # Handset movement
                     protocol_logger.log_rx(byte_data)
-                    logger.info("External movement detected (inward)")
+                    direction = "inward" if byte == CHAR_I else "outward"
+                    logger.info(f"External movement detected ({direction})")
 
                     # Set state IMMEDIATELY so UI sees is_moving=true
-                    self._movement_state = MovementState.MOVING_EXTERNAL
+                    self._set_movement_state(MOVING_EXTERNAL)
 
-                    # Start background thread to wait for 'F' packet
-                    # This releases the lock so API calls can continue
+                    # Start background thread to wait for 'F' packet (at most
+                    # one per movement). This releases the lock so API calls can continue
                     self._port.timeout = original_timeout
-                    threading.Thread(target=self._monitor_external_movement, daemon=True).start()
+                    self._start_external_movement_monitor()
 
                     return None  # Return immediately
 
-                elif char == 'O':  # Outward movement
-                    protocol_logger.log_rx(byte_data)
-                    logger.info("External movement detected (outward)")
-
-                    # Set state IMMEDIATELY so UI sees is_moving=true
-                    self._movement_state = MovementState.MOVING_EXTERNAL
-
-                    # Start background thread to wait for 'F' packet
-                    self._port.timeout = original_timeout
-                    threading.Thread(target=self._monitor_external_movement, daemon=True).start()
+                elif byte == CHAR_F:  # Start of response packet
+                    was_external = self._movement_state == MOVING_EXTERNAL
+                    response, parsed = self._complete_packet(byte_data, protocol_logger)
 
-                    return None  # Return immediately
-
-                elif char == 'F':  # Start of response packet
-                    remaining = self._port.read(8)
-
-                    if len(remaining) < 8:
+                    if parsed is None:
                         protocol_logger.log_error(
-                            f"Incomplete response: {1+len(remaining)}/9 bytes",
-                            byte_data + remaining
+                            f"Incomplete response: {len(response)}/9 bytes", response
                         )
-                        raise ProtocolError(f"Incomplete response: received {1+len(remaining)}/9 bytes")
-
-                    response = byte_data + remaining
-                    protocol_logger.log_rx(response)
+                        raise ProtocolError(f"Incomplete response: received {len(response)}/9 bytes")
+
+                    if expected is not None and parsed["cmd"] != expected:
+                        # Stray packet: keep waiting for the real reply
+                        logger.warning("Discarding stray %s packet while waiting for %s reply",
+                                       parsed["cmd"], cmd)
+                        protocol_logger.log_error(f"Stray packet while waiting for {cmd}", response)
+                        self._needs_flush = True
+                        strays += 1
+                        if strays > self.MAX_STRAY_PACKETS:
+                            raise ProtocolError(
+                                f"No {expected} reply to {cmd}: {strays} stray packets received"
+                            )
+                        want = 9
+                        continue
 
-                    parsed = parse_response(response)
-                    if parsed["cmd"] == "FD" and parsed["checksum_valid"]:
-                        new_pos = int(parsed["value"])
-                        if self._movement_state == MovementState.MOVING_EXTERNAL:
-                            logger.info(f"External movement finished at position {new_pos}")
-                        self._position = new_pos
+                    if was_external and parsed["cmd"] == "FD" and parsed["checksum_valid"]:
+                        logger.info(f"External movement finished at position {self._position}")
 
                     # Movement finished
-                    self._movement_state = MovementState.IDLE
-                    self._port.reset_input_buffer()
+                    self._set_movement_state(IDLE)
+                    if flush:
+                        # Drop leftovers already read; the kernel buffer is
+                        # only flushed after a failed exchange
+                        self._rx_buffer.clear()
 
-                    return bytes(response)
+                    return response
 
                 else:
                     logger.warning(f"Unexpected byte: 0x{byte_data[0]:02X}")
@@ -364,10 +745,11 @@ class RobofocusSerial(SerialProtocolInterface):
         """
         Wait for movement to finish, reading async chars.
 
-        Blocking method that reads one byte at a time (like INDI ReadResponse):
+        Blocking method that waits for a byte, then drains any burst already
+        buffered and processes it in one pass:
         - 'I' = inward movement, update position
         - 'O' = outward movement, update position
-        - 'F' = start of response packet, read remaining 8 bytes
+        - 'F' = start of response packet, read remaining bytes
 
         This method should be called in a background thread during movement.
 
@@ -385,94 +767,91 @@ class RobofocusSerial(SerialProtocolInterface):
             raise NotConnectedError("Focuser not connected")
 
         protocol_logger = get_protocol_logger()
-        start_time = time.time()
-        last_char_time = time.time()
+        start_time = time.monotonic()
+        last_char_time = start_time
         motion_logged = False
+        # Local accumulator, published to self._position once per tick
+        position = self._position
 
-        logger.debug(f"Waiting for movement to end (timeout: {timeout}s)")
+        logger.debug("Waiting for movement to end (timeout: %ss)", timeout)
 
         with self._serial_lock:
+            self._movement_reader = True
             # Set short timeout for individual reads
             original_timeout = self._port.timeout
             self._port.timeout = 0.5  # 500ms per-byte timeout
 
             try:
                 while True:
-                    elapsed = time.time() - start_time
+                    chunk = self._pull_chunk()
+                    # One clock read per burst (or per empty read)
+                    now = time.monotonic()
+
+                    elapsed = now - start_time
                     if elapsed > timeout:
-                        self._movement_state = MovementState.IDLE
+                        self._set_movement_state(IDLE)
                         protocol_logger.log_error(f"Movement timeout after {elapsed:.1f}s", b"")
                         raise SerialTimeoutError(f"Movement did not complete within {timeout} seconds")
 
-                    # Check for stall (no chars for 3 seconds)
-                    if time.time() - last_char_time > 3.0:
-                        logger.warning("Movement stall detected (no async chars for 3s)")
-                        # Try to recover by reading position
-                        self._movement_state = MovementState.IDLE
-                        self._port.reset_input_buffer()
-                        return self._position
-
-                    byte = self._port.read(1)
-
-                    if len(byte) == 0:
+                    if len(chunk) == 0:
+                        # Check for stall (no chars for 3 seconds)
+                        if now - last_char_time > 3.0:
+                            logger.warning("Movement stall detected (no async chars for 3s)")
+                            # Try to recover by reading position
+                            self._set_movement_state(IDLE)
+                            self._flush_input()
+                            return self._position
                         # Timeout on single byte read - continue waiting
                         continue
 
-                    last_char_time = time.time()
-                    char = chr(byte[0])
-
-                    if char == 'I':
-                        # Inward movement - log raw byte
-                        protocol_logger.log_rx(byte)
-                        self._position = max(0, self._position - 1)
-                        if not motion_logged:
-                            logger.info("Moving inward...")
-                            motion_logged = True
-
-                    elif char == 'O':
-                        # Outward movement - log raw byte
-                        protocol_logger.log_rx(byte)
-                        self._position += 1
-                        if not motion_logged:
-                            logger.info("Moving outward...")
-                            motion_logged = True
-
-                    elif char == 'F':
-                        # Start of response packet - read remaining 8 bytes
-                        remaining = self._port.read(8)
-
-                        if len(remaining) < 8:
-                            logger.warning(f"Incomplete response after 'F': {1+len(remaining)}/9 bytes")
+                    last_char_time = now
+                    packet_start = chunk.find(b"F")
+                    motion = chunk if packet_start < 0 else chunk[:packet_start]
+
+                    if motion:
+                        # 'I' = inward step, 'O' = outward step (counted in C)
+                        n_in = motion.count(b"I")
+                        n_out = motion.count(b"O")
+                        if n_in or n_out:
+                            protocol_logger.log_rx(motion)
+                            position = max(0, position + n_out - n_in)
+                            self._position = position
+                            if not motion_logged:
+                                logger.info("Moving inward..." if n_in else "Moving outward...")
+                                motion_logged = True
+                        if n_in + n_out < len(motion):
+                            # Unexpected characters - log and continue
+                            logger.debug("Unexpected bytes during movement: %s", motion.hex())
+
+                    if packet_start >= 0:
+                        # Start of response packet - read the rest of the 9 bytes
+                        response, parsed = self._complete_packet(
+                            chunk[packet_start:packet_start + 9], protocol_logger
+                        )
+
+                        if parsed is None:
+                            logger.warning(f"Incomplete response after 'F': {len(response)}/9 bytes")
                             # Try to continue
                             continue
 
-                        response = byte + remaining
-                        protocol_logger.log_rx(response)
-
-                        if logger.isEnabledFor(logging.DEBUG):
-                            hex_str = " ".join(f"{b:02X}" for b in response)
-                            logger.debug(f"RX: {hex_str}")
-
-                        parsed = parse_response(response)
-
                         if parsed["cmd"] == "FD" and parsed["checksum_valid"]:
-                            self._position = int(parsed["value"])
                             logger.info(f"Movement finished at position {self._position}")
                         else:
                             logger.warning(f"Unexpected response during movement: {parsed['cmd']}")
 
                         # Movement finished - flush and return
-                        self._port.reset_input_buffer()
-                        self._movement_state = MovementState.IDLE
+                        self._flush_input()
+                        self._set_movement_state(IDLE)
                         return self._position
 
-                    else:
-                        # Unexpected character - log and continue
-                        logger.debug(f"Unexpected byte during movement: 0x{byte[0]:02X}")
-
             finally:
                 # Restore original timeout
                 self._port.timeout = original_timeout
+                self._movement_reader = False
+
+    def reset_movement_state(self) -> None:
+        """Force the movement state machine back to IDLE."""
+        self._set_movement_state(IDLE)
 
     def get_position(self) -> int:
         """
@@ -488,10 +867,14 @@ class RobofocusSerial(SerialProtocolInterface):
 
         # During ANY movement, return cached position immediately
         # Background thread will update position when movement ends
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
+            return self._position
+
+        # IDLE: reuse a reading taken moments ago (clients poll back-to-back)
+        if time.monotonic() - self._position_time < self.POSITION_CACHE_TTL:
             return self._position
 
-        # IDLE: Query hardware
+        # Query hardware
         response = self.send_command("FG", 0)
 
         # If response is None, external movement was just detected
@@ -499,10 +882,11 @@ class RobofocusSerial(SerialProtocolInterface):
         if response is None:
             return self._position
 
-        parsed = parse_response(response)
+        parsed = self._parse(response)
 
         if parsed["cmd"] == "FD":
             self._position = int(parsed["value"])
+            self._position_time = time.monotonic()
             return self._position
         else:
             logger.warning(f"Unexpected response to FG query: {parsed['cmd']}")
@@ -513,7 +897,8 @@ class RobofocusSerial(SerialProtocolInterface):
         Start background thread to monitor external movement and wait for 'F' packet.
         Called when I/O char is detected during FG query.
         """
-        if hasattr(self, '_external_monitor_thread') and self._external_monitor_thread and self._external_monitor_thread.is_alive():
+        monitor = self._external_monitor_thread
+        if monitor is not None and monitor.is_alive():
             return  # Already running
 
         self._external_monitor_thread = threading.Thread(
@@ -528,65 +913,62 @@ class RobofocusSerial(SerialProtocolInterface):
         Runs until 'F' is received or timeout.
         """
         protocol_logger = get_protocol_logger()
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout = 60.0  # Max 60 seconds for external movement
 
         logger.debug("External movement monitor thread started")
 
         with self._serial_lock:
             if not self._port or not self._port.is_open:
-                self._movement_state = MovementState.IDLE
+                self._set_movement_state(IDLE)
                 return
 
+            self._movement_reader = True
             original_timeout = self._port.timeout
             self._port.timeout = 0.5  # 500ms per read
 
             try:
-                while time.time() - start_time < timeout:
-                    if self._movement_state != MovementState.MOVING_EXTERNAL:
+                while time.monotonic() - start_time < timeout:
+                    if self._movement_state != MOVING_EXTERNAL:
                         # State changed externally, stop monitoring
                         break
 
-                    byte_data = self._port.read(1)
+                    chunk = self._pull_chunk()
 
-                    if len(byte_data) == 0:
+                    if not chunk:
                         # No data - keep waiting
                         continue
 
-                    char = chr(byte_data[0])
-
-                    if char in ('I', 'O'):
-                        protocol_logger.log_rx(byte_data)
-                        continue
+                    # Handle the whole burst at once: everything before the
+                    # first 'F' is I/O chars (or noise), logged in one entry
+                    packet_start = chunk.find(b"F")
+                    motion = chunk if packet_start < 0 else chunk[:packet_start]
+                    if motion:
+                        protocol_logger.log_rx(motion)
 
-                    elif char == 'F':
-                        remaining = self._port.read(8)
-
-                        if len(remaining) == 8:
-                            response = byte_data + remaining
-                            protocol_logger.log_rx(response)
+                    if packet_start >= 0:
+                        _, parsed = self._complete_packet(
+                            chunk[packet_start:packet_start + 9], protocol_logger
+                        )
 
-                            parsed = parse_response(response)
+                        if parsed is not None:
                             if parsed["cmd"] == "FD" and parsed["checksum_valid"]:
-                                self._position = int(parsed["value"])
                                 logger.info(f"External movement finished at position {self._position}")
 
-                            self._movement_state = MovementState.IDLE
-                            self._port.reset_input_buffer()
+                            self._set_movement_state(IDLE)
+                            self._flush_input()
                             return
                         else:
                             logger.warning("Incomplete 'F' packet in monitor")
 
-                    else:
-                        protocol_logger.log_rx(byte_data)
-
                 # Timeout
                 logger.warning("External movement monitor timeout, resetting to IDLE")
-                self._movement_state = MovementState.IDLE
-                self._port.reset_input_buffer()
+                self._set_movement_state(IDLE)
+                self._flush_input()
 
             finally:
                 self._port.timeout = original_timeout
+                self._movement_reader = False
                 logger.debug("External movement monitor thread finished")
 
     def move_absolute(self, target: int) -> None:
@@ -594,11 +976,11 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        if self._movement_state != MovementState.IDLE:
-            raise MovementInProgressError(f"Cannot start move during {self._movement_state.value} movement")
+        if self._movement_state != IDLE:
+            raise MovementInProgressError(f"Cannot start move during {_STATE_NAMES[self._movement_state]} movement")
 
         self._target_position = target
-        self._movement_state = MovementState.MOVING_PROGRAMMATIC
+        self._set_movement_state(MOVING_PROGRAMMATIC)
 
         logger.info(f"Moving to position {target}")
 
@@ -606,27 +988,24 @@ class RobofocusSerial(SerialProtocolInterface):
 
         with self._serial_lock:
             if not self._port or not self._port.is_open:
-                self._movement_state = MovementState.IDLE
+                self._set_movement_state(IDLE)
                 raise NotConnectedError("Serial port not open")
 
-            # Flush buffers before sending move command
-            self._port.reset_input_buffer()
-            self._port.reset_output_buffer()
-
-            # Encode and send command
-            packet = encode_command("FG", target)
+            # Encode into the reusable TX buffer (guarded by _serial_lock)
+            packet = encode_into(self._tx_buffer, "FG", target)
 
             if logger.isEnabledFor(logging.DEBUG):
-                hex_str = " ".join(f"{b:02X}" for b in packet)
-                logger.debug(f"TX: {hex_str}")
+                logger.debug("TX: %s", packet.hex(" ").upper())
 
             # Log TX to protocol logger
             protocol_logger.log_tx(packet, "FG", target)
 
-            self._port.write(packet)
-            self._port.flush()
+            # Flush both directions before sending move command
+            with self._write_lock:
+                self._flush_both()
+                self._port.write(packet)
 
-        logger.debug(f"Move command sent to position {target}")
+        logger.debug("Move command sent to position %d", target)
 
     def halt(self) -> None:
         """
@@ -639,31 +1018,43 @@ class RobofocusSerial(SerialProtocolInterface):
 
         logger.info("Halting movement")
 
-        protocol_logger = get_protocol_logger()
+        # Halt is special - allowed during movement. A movement reader holds
+        # _serial_lock for the whole move, so FQ then goes out under the write
+        # lock alone and the reader consumes the final packet. Any other
+        # holder is a short exchange: wait for it and own the port.
+        while True:
+            if self._serial_lock.acquire(timeout=0.05):
+                try:
+                    self._write_halt()
+
+                    # Wait briefly for hardware to stop
+                    time.sleep(0.2)
+
+                    # Drop the response (might include leftover I/O chars)
+                    self._flush_input()
+                    self._needs_flush = False
+                finally:
+                    self._serial_lock.release()
+                self._set_movement_state(IDLE)
+                break
+            if self._movement_reader:
+                self._write_halt()
+                break
 
-        # Halt is special - allowed during movement
-        with self._serial_lock:
+        logger.info("Halt command sent")
+
+    def _write_halt(self) -> None:
+        """Write the FQ packet under the write lock."""
+        with self._write_lock:
             if not self._port or not self._port.is_open:
                 raise NotConnectedError("Serial port not open")
 
-            # Flush and send halt command
-            self._port.reset_input_buffer()
             self._port.reset_output_buffer()
 
-            packet = encode_command("FQ", 0)
-            protocol_logger.log_tx(packet, "FQ", 0)
+            packet = get_zero_packet("FQ")
+            get_protocol_logger().log_tx(packet, "FQ", 0)
 
             self._port.write(packet)
-            self._port.flush()
-
-            # Wait briefly for hardware to stop
-            time.sleep(0.2)
-
-            # Read response (might include leftover I/O chars)
-            self._port.reset_input_buffer()
-
-        self._movement_state = MovementState.IDLE
-        logger.info("Halt command sent")
 
     def get_temperature(self) -> float:
         """
@@ -674,26 +1065,23 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        current_time = time.time()
-        cache_age = current_time - self._temperature_cache_time
-
         # During movement, ALWAYS return cached value
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
             if self._temperature_cache is not None:
-                logger.debug(f"Temperature during movement (cached, age {cache_age:.0f}s): {self._temperature_cache:.2f}°C")
+                logger.debug("Temperature during movement (cached): %.2f°C", self._temperature_cache)
                 return self._temperature_cache
             # No cached value available - return a default
             logger.warning("No cached temperature available during movement, returning 20.0°C")
             return 20.0
 
         # When idle, check cache validity
-        if self._temperature_cache is not None and cache_age < self._temperature_cache_max_age:
-            logger.debug(f"Temperature (cached, age {cache_age:.0f}s): {self._temperature_cache:.2f}°C")
+        if self._temperature_cache is not None and time.monotonic() < self._temperature_cache_expiry:
+            logger.debug("Temperature (cached): %.2f°C", self._temperature_cache)
             return self._temperature_cache
 
         # Query hardware for fresh temperature
         response = self.send_command("FT", 0)
-        parsed = parse_response(response)
+        parsed = self._parse(response)
 
         if parsed["cmd"] != "FT":
             logger.warning(f"Unexpected response to FT: {parsed['cmd']}")
@@ -711,14 +1099,27 @@ class RobofocusSerial(SerialProtocolInterface):
 
         # Cache the temperature
         self._temperature_cache = celsius
-        self._temperature_cache_time = current_time
+        self._temperature_cache_expiry = time.monotonic() + self._temperature_cache_max_age
 
         logger.info(f"Temperature: {celsius:.2f}°C (raw ADC: {raw_adc})")
         return celsius
 
     def is_moving(self) -> bool:
         """Check if focuser is currently moving."""
-        return self._movement_state != MovementState.IDLE
+        return not self._idle_event.is_set()
+
+    def wait_until_idle(self, timeout: float) -> bool:
+        """Block until the movement state returns to IDLE (event-driven)."""
+        return self._idle_event.wait(timeout)
+
+    def _set_movement_state(self, state: int) -> None:
+        """Update the movement state and signal idle waiters."""
+        self._movement_state = state
+        self._position_time = 0.0  # Any transition invalidates the FG reading
+        if state == IDLE:
+            self._idle_event.set()
+        else:
+            self._idle_event.clear()
 
     def get_backlash(self) -> tuple[int, int]:
         """
@@ -734,12 +1135,16 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
             raise MovementInProgressError("Cannot query backlash during movement")
 
         # Send FB with 0 to read current settings
         response = self.send_command("FB", 0)
-        parsed = parse_response(response)
+        return self._parse_backlash(response)
+
+    def _parse_backlash(self, response: bytes) -> Tuple[int, int]:
+        """Parse an FB query response into (direction, amount)."""
+        parsed = self._parse(response)
 
         if parsed["cmd"] != "FB":
             logger.warning(f"Unexpected response to FB: {parsed['cmd']}")
@@ -752,7 +1157,7 @@ class RobofocusSerial(SerialProtocolInterface):
         direction = raw_value // 100000
         amount = raw_value % 100000
 
-        logger.debug(f"Backlash settings: direction={direction}, amount={amount}")
+        logger.debug("Backlash settings: direction=%s, amount=%s", direction, amount)
         return (direction, amount)
 
     def set_backlash(self, direction: int, amount: int) -> None:
@@ -766,7 +1171,7 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
             raise MovementInProgressError("Cannot set backlash during movement")
 
         if direction not in (2, 3):
@@ -781,7 +1186,7 @@ class RobofocusSerial(SerialProtocolInterface):
         logger.info(f"Setting backlash: direction={direction} ({'IN' if direction == 2 else 'OUT'}), amount={amount}")
 
         response = self.send_command("FB", value)
-        parsed = parse_response(response)
+        parsed = self._parse(response)
 
         if parsed["cmd"] != "FB":
             logger.warning(f"Unexpected response to FB set: {parsed['cmd']}")
@@ -796,11 +1201,15 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
             raise MovementInProgressError("Cannot query max travel during movement")
 
         response = self.send_command("FL", 0)
-        parsed = parse_response(response)
+        return self._parse_max_travel(response)
+
+    def _parse_max_travel(self, response: bytes) -> int:
+        """Parse an FL query response into the max travel limit."""
+        parsed = self._parse(response)
 
         if parsed["cmd"] != "FL":
             logger.warning(f"Unexpected response to FL: {parsed['cmd']}")
@@ -809,9 +1218,36 @@ class RobofocusSerial(SerialProtocolInterface):
         raw_value = int(parsed["value"])
         max_travel = raw_value % 100000
 
-        logger.debug(f"Hardware max travel: {max_travel}")
+        logger.debug("Hardware max travel: %s", max_travel)
         return max_travel
 
+    def query_all_settings(self) -> HardwareSettings:
+        """
+        Read max travel and backlash in one pipelined round-trip.
+
+        Returns:
+            HardwareSettings snapshot (fields None if the query failed).
+        """
+        settings = HardwareSettings()
+
+        try:
+            fl_response, fb_response = self.send_commands_batch([("FL", 0), ("FB", 0)])
+        except Exception as e:
+            logger.warning("Could not read hardware settings: %s", e)
+            return settings
+
+        try:
+            settings.max_travel = self._parse_max_travel(fl_response)
+        except Exception as e:
+            logger.warning("Could not read max travel from hardware: %s", e)
+
+        try:
+            settings.backlash = self._parse_backlash(fb_response)
+        except Exception as e:
+            logger.warning("Could not read backlash from hardware: %s", e)
+
+        return settings
+
     def set_max_travel(self, value: int) -> None:
         """
         Write maximum travel limit to hardware.
@@ -822,7 +1258,7 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
             raise MovementInProgressError("Cannot set max travel during movement")
 
         if value < 1 or value > 65535:
@@ -831,7 +1267,7 @@ class RobofocusSerial(SerialProtocolInterface):
         logger.info(f"Setting hardware max travel to {value}")
 
         response = self.send_command("FL", value)
-        parsed = parse_response(response)
+        parsed = self._parse(response)
 
         if parsed["cmd"] != "FL":
             logger.warning(f"Unexpected response to FL set: {parsed['cmd']}")
@@ -852,7 +1288,7 @@ class RobofocusSerial(SerialProtocolInterface):
         if not self.is_connected():
             raise NotConnectedError("Focuser not connected")
 
-        if self._movement_state != MovementState.IDLE:
+        if self._movement_state != IDLE:
             raise MovementInProgressError("Cannot sync position during movement")
 
         if value < 0 or value > 999999:
@@ -865,26 +1301,27 @@ class RobofocusSerial(SerialProtocolInterface):
         logger.info(f"Syncing hardware position to {hw_value}" + (f" (requested {value})" if hw_value != value else ""))
 
         response = self.send_command("FS", hw_value)
-        parsed = parse_response(response)
+        parsed = self._parse(response)
 
         if parsed["cmd"] != "FS":
             logger.warning(f"Unexpected response to FS: {parsed['cmd']}")
 
         # Update cached position with actual hardware value
-        self._position_cache = hw_value
+        self._position = hw_value
+        self._position_time = 0.0
 
-    def read_async_chars(self) -> List[str]:
+    def read_async_chars(self) -> bytes:
         """
         Read asynchronous status characters without blocking.
 
         DEPRECATED: With the new architecture, async chars are read internally
         by wait_for_movement_end(). This method exists only for interface
-        compatibility and returns an empty list.
+        compatibility and returns nothing.
 
         Returns:
-            Empty list (async chars handled internally).
+            Empty bytes (async chars handled internally).
         """
-        return []
+        return b""
 
     @property
     def firmware_version(self) -> Optional[str]:
@@ -895,15 +1332,3 @@ class RobofocusSerial(SerialProtocolInterface):
     def port_name(self) -> str:
         """Get configured port name."""
         return self._config.port
-
-    # Legacy property for compatibility
-    @property
-    def _is_moving_flag(self) -> bool:
-        """Legacy property for backward compatibility with controller."""
-        return self._movement_state != MovementState.IDLE
-
-    @_is_moving_flag.setter
-    def _is_moving_flag(self, value: bool) -> None:
-        """Legacy setter - sets state to IDLE if False."""
-        if not value:
-            self._movement_state = MovementState.IDLE
@@ -8,8 +8,8 @@ import threading
 import time
 import random
 import logging
-from typing import List, Optional
-from datetime import datetime
+from collections import deque
+from typing import Deque, Optional
 
 from robofocus_alpaca.protocol.interface import SerialProtocolInterface
 from robofocus_alpaca.protocol.encoder import encode_command, parse_response
@@ -26,12 +26,20 @@ from robofocus_alpaca.utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Commands that touch position/movement state (guarded by _position_lock);
+# everything else only touches configuration (guarded by _config_lock)
+_POSITION_COMMANDS = frozenset(("FG", "FQ", "FS", "FI", "FO"))
+
 
 class MockSerialProtocol(SerialProtocolInterface):
     """
     Mock implementation of serial protocol for testing without hardware.
     """
 
+    # Max queued async-char chunks (one per movement tick, ~100 s of motion).
+    # Like a real UART buffer, the oldest chunks are dropped when nobody reads.
+    ASYNC_BUFFER_CHUNKS = 1024
+
     def __init__(self, config: SimulatorConfig):
         """
         Initialize simulator.
@@ -41,13 +49,23 @@ class MockSerialProtocol(SerialProtocolInterface):
         """
         self.config = config
         self._connected = False
-        self._lock = threading.Lock()
+
+        # Fault injection / latency settings are fixed for the simulator's lifetime
+        self._latency_s = config.response_latency_ms / 1000.0
+        self._inject_timeout = config.inject_timeout
+        self._checksum_error_rate = config.inject_checksum_error_rate
+        # Lock order: _conn_lock, then _position_lock, then _config_lock
+        self._conn_lock = threading.Lock()      # connect/disconnect
+        self._position_lock = threading.Lock()  # position, target, movement
+        self._config_lock = threading.Lock()    # backlash, limits, motor, switches
 
         # Virtual hardware state
         self._position = config.initial_position
         self._target_position = config.initial_position
         self._is_moving = False
         self._firmware_version = config.firmware_version
+        # FV reply never changes; encode it once
+        self._fv_response = encode_command("FV", int(self._firmware_version))
 
         # Backlash configuration
         self._backlash_mode = 1  # 1=off, 2=inward, 3=outward
@@ -63,36 +81,55 @@ class MockSerialProtocol(SerialProtocolInterface):
         self._motor_ticks = 3
 
         # Power switches (1=off, 2=on)
-        self._switches = [1, 1, 1, 1]  # All off initially
+        # One decimal digit per switch, switch 1 first (the FP reply value)
+        self._switches = 1111  # All off initially
 
         # Movement simulation
         self._movement_thread: Optional[threading.Thread] = None
         self._stop_movement = threading.Event()
-        self._async_chars: List[str] = []
-        self._async_chars_lock = threading.Lock()
+        self._movement_done = threading.Event()  # Set while not moving
+        self._movement_done.set()
+        # Chunks of async chars; deque append/popleft are atomic, so no lock
+        self._async_chars: Deque[bytes] = deque(maxlen=self.ASYNC_BUFFER_CHUNKS)
 
         # Temperature simulation
-        self._start_time = datetime.now()
+        self._start_time = time.monotonic()
+        self._drift_per_sec = config.temperature_drift_per_hour / 3600.0
+
+        # Command dispatch table: cmd -> handler(value)
+        self._handlers = {
+            "FV": lambda value: self._handle_fv(),
+            "FG": self._handle_fg,
+            "FT": lambda value: self._handle_ft(),
+            "FQ": lambda value: self._handle_fq(),
+            "FB": self._handle_fb,
+            "FL": self._handle_fl,
+            "FC": self._handle_fc,
+            "FP": self._handle_fp,
+            "FS": self._handle_fs,
+            "FI": self._handle_fi,
+            "FO": self._handle_fo,
+        }
 
         logger.info("MockSerialProtocol initialized")
 
     def connect(self) -> None:
         """Open simulated connection."""
-        with self._lock:
+        with self._conn_lock:
             if self._connected:
                 logger.warning("Already connected")
                 return
 
             # Simulate connection delay
-            if self.config.response_latency_ms > 0:
-                time.sleep(self.config.response_latency_ms / 1000.0)
+            if self._latency_s:
+                time.sleep(self._latency_s)
 
             self._connected = True
             logger.info("Simulator connected (firmware version: %s)", self._firmware_version)
 
     def disconnect(self) -> None:
         """Close simulated connection."""
-        with self._lock:
+        with self._conn_lock:
             if not self._connected:
                 return
 
@@ -133,46 +170,29 @@ class MockSerialProtocol(SerialProtocolInterface):
         protocol_logger.log_tx(tx_packet, cmd, value)
 
         # Simulate latency
-        if self.config.response_latency_ms > 0:
-            time.sleep(self.config.response_latency_ms / 1000.0)
+        if self._latency_s:
+            time.sleep(self._latency_s)
 
         # Inject timeout error
-        if self.config.inject_timeout:
+        if self._inject_timeout:
             logger.warning("[SIMULATOR] Injected timeout for testing")
             protocol_logger.log_error("Simulated timeout")
             time.sleep(10)  # Simulate timeout
 
-        # Route to appropriate handler
-        with self._lock:
-            if cmd == "FV":
-                response = self._handle_fv()
-            elif cmd == "FG":
-                response = self._handle_fg(value)
-            elif cmd == "FT":
-                response = self._handle_ft()
-            elif cmd == "FQ":
-                response = self._handle_fq()
-            elif cmd == "FB":
-                response = self._handle_fb(value)
-            elif cmd == "FL":
-                response = self._handle_fl(value)
-            elif cmd == "FC":
-                response = self._handle_fc(value)
-            elif cmd == "FP":
-                response = self._handle_fp(value)
-            elif cmd == "FS":
-                response = self._handle_fs(value)
-            elif cmd == "FI":
-                response = self._handle_fi(value)
-            elif cmd == "FO":
-                response = self._handle_fo(value)
+        # Route to appropriate handler; queries of one state group do not
+        # wait for handlers of the other (e.g. FT during a move)
+        lock = self._position_lock if cmd in _POSITION_COMMANDS else self._config_lock
+        handler = self._handlers.get(cmd)
+        with lock:
+            if handler is not None:
+                response = handler(value)
             else:
                 # Unknown command, echo back
                 logger.warning("Unknown command: %s", cmd)
                 response = encode_command(cmd, value)
 
         # Inject checksum error
-        if random.random() < self.config.inject_checksum_error_rate:
+        if self._checksum_error_rate and random.random() < self._checksum_error_rate:
             logger.warning("[SIMULATOR] Injected checksum error for testing")
             response = response[:8] + bytes([random.randint(0, 255)])
 
@@ -180,14 +200,15 @@ class MockSerialProtocol(SerialProtocolInterface):
         if response:
             protocol_logger.log_rx(response)
 
-        logger.debug("[SIMULATOR] TX: %s -> RX: %s",
-                     tx_packet.hex(), response.hex() if response else "empty")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SIMULATOR] TX: %s -> RX: %s",
+                         tx_packet.hex(), response.hex() if response else "empty")
 
         return response
 
     def _handle_fv(self) -> bytes:
         """Handle FV (Get Version) command."""
-        return encode_command("FV", int(self._firmware_version))
+        return self._fv_response
 
     def _handle_fg(self, value: int) -> bytes:
         """
@@ -201,19 +222,20 @@ class MockSerialProtocol(SerialProtocolInterface):
             return encode_command("FD", self._position)
         else:
             # Movement mode
-            self._target_position = min(value, self._max_limit)
-            if self._target_position != value:
-                logger.warning("Position clamped: %d -> %d", value, self._target_position)
+            target = min(value, self._max_limit)
+            if target != value:
+                logger.warning("Position clamped: %d -> %d", value, target)
 
-            if self._target_position == self._position:
-                # Already at target
+            if target == self._position:
+                # Already at target (a running movement stops here)
                 logger.info("Already at target position: %d", self._position)
+                self._target_position = target
                 return encode_command("FD", self._position)
 
             # Start movement in background
-            self._start_movement(self._target_position)
+            self._start_movement(target)
 
-            return encode_command("FD", self._target_position)
+            return encode_command("FD", target)
 
     def _handle_ft(self) -> bytes:
         """Handle FT (Get Temperature) command."""
@@ -226,12 +248,8 @@ class MockSerialProtocol(SerialProtocolInterface):
         """Handle FQ (Halt) command."""
         if self._is_moving:
             logger.info("[SIMULATOR] Halting movement at position %d", self._position)
+            # The movement thread wakes immediately and queues the final 'F'
             self._stop_movement.set()
-            if self._movement_thread:
-                self._movement_thread.join(timeout=2.0)
-            # Queue 'F' character
-            with self._async_chars_lock:
-                self._async_chars.append('F')
         return encode_command("FQ", 0)
 
     def _handle_fb(self, value: int) -> bytes:
@@ -278,25 +296,15 @@ class MockSerialProtocol(SerialProtocolInterface):
 
     def _handle_fp(self, value: int) -> bytes:
         """Handle FP (Power Switches) command."""
-        if value == 0:
-            # Query mode
-            response_value = (self._switches[0] * 1000 +
-                              self._switches[1] * 100 +
-                              self._switches[2] * 10 +
-                              self._switches[3])
-            return encode_command("FP", response_value)
-        else:
-            # Toggle switch
+        if value != 0:
+            # Toggle switch: flip its digit between 1 and 2
             switch_num = value // 100000
             if 1 <= switch_num <= 4:
-                idx = switch_num - 1
-                self._switches[idx] = 2 if self._switches[idx] == 1 else 1
-                logger.info("Toggled switch %d to %d", switch_num, self._switches[idx])
-            response_value = (self._switches[0] * 1000 +
-                              self._switches[1] * 100 +
-                              self._switches[2] * 10 +
-                              self._switches[3])
-            return encode_command("FP", response_value)
+                place = 10 ** (4 - switch_num)
+                digit = (self._switches // place) % 10
+                self._switches += (3 - 2 * digit) * place
+                logger.info("Toggled switch %d to %d", switch_num, 3 - digit)
+        return encode_command("FP", self._switches)
 
     def _handle_fs(self, value: int) -> bytes:
         """Handle FS (Sync Position) command."""
@@ -308,15 +316,17 @@ class MockSerialProtocol(SerialProtocolInterface):
 
     def _handle_fi(self, value: int) -> bytes:
         """Handle FI (Relative Inward) command."""
+        if value == 0:
+            return encode_command("FI", 0)
         target = max(self._position - value, self._min_limit)
-        self._target_position = target
         self._start_movement(target)
         return encode_command("FI", value)
 
     def _handle_fo(self, value: int) -> bytes:
         """Handle FO (Relative Outward) command."""
+        if value == 0:
+            return encode_command("FO", 0)
         target = min(self._position + value, self._max_limit)
-        self._target_position = target
         self._start_movement(target)
         return encode_command("FO", value)
 
@@ -327,62 +337,79 @@ class MockSerialProtocol(SerialProtocolInterface):
         Args:
             target: Target position.
         """
-        # Stop existing movement
-        if self._is_moving:
-            self._stop_movement.set()
-            if self._movement_thread:
-                self._movement_thread.join(timeout=2.0)
-
-        self._stop_movement.clear()
+        if self._is_moving and not self._stop_movement.is_set() and (
+            (target - self._position) * (self._target_position - self._position) > 0
+        ):
+            # Same direction: the running thread rereads the target each tick
+            self._target_position = target
+            logger.info("Movement retargeted: %d -> %d", self._position, target)
+            return
+
+        # Supersede any existing movement. Each movement has its own stop
+        # event, so the old thread exits on its own without being joined
+        # here (it needs _position_lock, which the caller holds).
+        self._stop_movement.set()
+        stop = threading.Event()
+        self._stop_movement = stop
+
+        self._movement_done.clear()
         self._is_moving = True
         self._target_position = target
 
         self._movement_thread = threading.Thread(
             target=self._simulate_movement,
-            args=(target,),
+            args=(target, stop),
             daemon=True
         )
         self._movement_thread.start()
 
         logger.info("Movement started: %d -> %d", self._position, target)
 
-    def _simulate_movement(self, target: int) -> None:
+    def _simulate_movement(self, target: int, stop: threading.Event) -> None:
         """
         Simulate movement by updating position incrementally.
 
         Args:
-            target: Target position.
+            target: Initial target position (retargets are read from
+                _target_position).
+            stop: Stop event of this movement (set by halt or a newer move).
         """
         direction = 1 if target > self._position else -1
-        char = 'O' if direction > 0 else 'I'
+        char = b"O" if direction > 0 else b"I"
 
+        # Loop invariants: a full tick's step and its async chars
         steps_per_update = max(1, self.config.movement_speed_steps_per_sec // 10)
         sleep_time = steps_per_update / self.config.movement_speed_steps_per_sec
-
-        while not self._stop_movement.is_set():
-            with self._lock:
-                if self._position == target:
+        full_step = steps_per_update * direction
+        full_chunk = char * steps_per_update
+
+        while True:
+            with self._position_lock:
+                if stop is not self._stop_movement:
+                    return  # Superseded by a newer movement, which owns the state
+
+                # Steps left in the direction of travel (<= 0: reached or passed)
+                target = self._target_position
+                remaining = (target - self._position) * direction
+                if stop.is_set() or remaining <= 0:
+                    # Finish under the same lock a retarget takes, so none is lost
+                    self._is_moving = False
+                    self._movement_done.set()
+
+                    # Queue 'F' character + final position packet
+                    self._async_chars.append(b"F")
                     break
 
-                # Move towards target
-                remaining = abs(target - self._position)
-                step = min(steps_per_update, remaining) * direction
-                self._position += step
-
-                # Queue async chars
-                with self._async_chars_lock:
-                    for _ in range(abs(step)):
-                        self._async_chars.append(char)
-
-            time.sleep(sleep_time)
-
-        # Movement finished
-        with self._lock:
-            self._is_moving = False
+                # Move towards target, queueing one async chunk per tick
+                if remaining >= steps_per_update:
+                    self._position += full_step
+                    self._async_chars.append(full_chunk)
+                else:
+                    self._position = target
+                    self._async_chars.append(char * remaining)
 
-            # Queue 'F' character + final position packet
-            with self._async_chars_lock:
-                self._async_chars.append('F')
+            # Interruptible sleep: halt wakes the thread at once
+            stop.wait(sleep_time)
 
         logger.info("Movement completed at position: %d", self._position)
 
@@ -404,19 +431,44 @@ class MockSerialProtocol(SerialProtocolInterface):
             base_temp += noise
 
         # Add drift
-        if self.config.temperature_drift_per_hour != 0:
-            elapsed_hours = (datetime.now() - self._start_time).total_seconds() / 3600.0
-            drift = elapsed_hours * self.config.temperature_drift_per_hour
-            base_temp += drift
+        if self._drift_per_sec:
+            base_temp += (time.monotonic() - self._start_time) * self._drift_per_sec
 
         return base_temp
 
-    def read_async_chars(self) -> List[str]:
-        """Read asynchronous status characters."""
-        with self._async_chars_lock:
-            chars = self._async_chars.copy()
-            self._async_chars.clear()
-        return chars
+    def snapshot(self) -> dict:
+        """
+        Read the virtual hardware state for status display, without locking.
+
+        Each field is a single attribute read (atomic under the GIL), so the
+        GUI can poll this while a move or command is in progress. Fields may
+        come from adjacent movement ticks.
+
+        Returns:
+            Dictionary matching the simulator status fields.
+        """
+        return {
+            "position": self._position,
+            "target_position": self._target_position,
+            "is_moving": self._is_moving,
+            "temperature": self._get_simulated_temperature(),
+            "firmware_version": self._firmware_version,
+            "max_step": self._max_limit,
+        }
+
+    def read_async_chars(self) -> bytes:
+        """
+        Read asynchronous status characters.
+
+        The oldest characters are lost if more than ASYNC_BUFFER_CHUNKS
+        movement ticks were queued since the last read.
+        """
+        chunks = self._async_chars
+        popleft = chunks.popleft
+        drained = []
+        while chunks:
+            drained.append(popleft())
+        return b"".join(drained)
 
     def get_position(self) -> int:
         """Get current position."""
@@ -463,7 +515,7 @@ class MockSerialProtocol(SerialProtocolInterface):
         """
         Wait for movement to finish.
 
-        In simulator, just waits for _is_moving to become False.
+        In simulator, just waits for the movement thread to signal completion.
 
         Args:
             timeout: Maximum time to wait in seconds.
@@ -474,16 +526,21 @@ class MockSerialProtocol(SerialProtocolInterface):
         if not self._connected:
             raise NotConnectedError("Simulator not connected")
 
-        start_time = time.time()
-
-        while self._is_moving:
-            if time.time() - start_time > timeout:
-                self._is_moving = False
-                raise TimeoutError(f"Movement did not complete within {timeout} seconds")
-            time.sleep(0.1)
+        if not self._movement_done.wait(timeout):
+            self.reset_movement_state()
+            raise TimeoutError(f"Movement did not complete within {timeout} seconds")
 
         return self._position
 
+    def wait_until_idle(self, timeout: float) -> bool:
+        """Block until the simulated movement finishes (event-driven)."""
+        return self._movement_done.wait(timeout)
+
+    def reset_movement_state(self) -> None:
+        """Force the simulated movement flag back to idle."""
+        self._is_moving = False
+        self._movement_done.set()
+
     def get_backlash(self) -> tuple[int, int]:
         """
         Read current backlash compensation settings.
@@ -528,7 +585,7 @@ class MockSerialProtocol(SerialProtocolInterface):
         if value < 1 or value > 65535:
             raise ValueError(f"Max travel must be 1-65535, got {value}")
         self._max_limit = value
-        logger.info(f"Simulator max travel set to {value}")
+        logger.info("Simulator max travel set to %d", value)
 
     def sync_position(self, value: int) -> None:
         """Sync/set the simulated position counter to a specific value.
@@ -547,24 +604,25 @@ class MockSerialProtocol(SerialProtocolInterface):
         old_pos = self._position
         self._position = hw_value
         self._target_position = hw_value
-        logger.info(f"Simulator position synced: {old_pos} -> {hw_value}" + (f" (requested {value})" if hw_value != value else ""))
+        logger.info("Simulator position synced: %d -> %d%s", old_pos, hw_value,
+                    f" (requested {value})" if hw_value != value else "")
 
     def reset(self) -> None:
         """Reset simulator to initial state (for testing)."""
-        with self._lock:
-            if self._is_moving:
-                self._stop_movement.set()
-                if self._movement_thread:
-                    self._movement_thread.join(timeout=2.0)
+        if self._is_moving:
+            self._stop_movement.set()
+            if self._movement_thread:
+                self._movement_thread.join(timeout=2.0)
 
+        with self._position_lock, self._config_lock:
             self._position = self.config.initial_position
             self._target_position = self.config.initial_position
             self._is_moving = False
+            self._movement_done.set()
             self._backlash_mode = 1
             self._backlash_amount = 0
-            self._switches = [1, 1, 1, 1]
+            self._switches = 1111
 
-            with self._async_chars_lock:
-                self._async_chars.clear()
+            self._async_chars.clear()
 
         logger.info("Simulator reset to initial state")
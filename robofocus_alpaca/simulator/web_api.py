@@ -2,6 +2,8 @@
 Web API endpoints for simulator control via GUI.
 """
 
+import asyncio
+import functools
 import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Request
@@ -24,6 +26,33 @@ def get_simulator(request: Request) -> MockSerialProtocol:
     return simulator
 
 
+def translate_errors(device_status: int = 400):
+    """
+    Decorator mapping exceptions from a route to HTTP errors.
+
+    HTTPExceptions pass through, RobofocusExceptions become device_status
+    and anything else is logged with its traceback and becomes a 500.
+
+    Args:
+        device_status: Status code for RobofocusException.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except RobofocusException as e:
+                logger.error("Robofocus error in %s: %s", fn.__name__, e)
+                raise HTTPException(status_code=device_status, detail=str(e))
+            except Exception as e:
+                logger.exception("Unexpected error in %s", fn.__name__)
+                raise HTTPException(status_code=500, detail=str(e))
+        return wrapper
+    return decorator
+
+
 class SimulatorStatus(BaseModel):
     """Simulator status response."""
     position: int
@@ -42,103 +71,80 @@ class MoveRequest(BaseModel):
 
 
 @router.get("/status", response_model=SimulatorStatus)
+@translate_errors()
 async def get_status(request: Request):
     """Get current simulator status."""
     simulator = get_simulator(request)
-
-    try:
-        status = SimulatorStatus(
-            position=simulator._position,
-            target_position=simulator._target_position,
-            is_moving=simulator.is_moving(),
-            temperature=simulator._get_simulated_temperature(),
-            firmware_version=simulator._firmware_version,
-            max_step=simulator._max_limit
-        )
-        return status
-    except Exception as e:
-        logger.error(f"Error getting simulator status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return SimulatorStatus(**simulator.snapshot())
 
 
 @router.post("/move")
+@translate_errors()
 async def move_simulator(request: Request, move_data: MoveRequest):
     """Move simulator (relative or absolute)."""
     simulator = get_simulator(request)
+    current_pos = simulator._position
 
-    try:
-        current_pos = simulator._position
-
+    if move_data.position is not None:
         # Absolute move
-        if move_data.position is not None:
-            target = move_data.position
-            if target < simulator._min_limit or target > simulator._max_limit:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Position {target} out of range [0, {simulator._max_limit}]"
-                )
-
-            logger.info(f"[Web GUI] User action: GoTo position {target} (current: {current_pos})")
-            simulator.move_absolute(target)
-
-            return {
-                "status": "ok",
-                "message": f"Moving to position {target}",
-                "from": current_pos,
-                "to": target
-            }
+        target = move_data.position
+        if target < simulator._min_limit or target > simulator._max_limit:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Position {target} out of range [0, {simulator._max_limit}]"
+            )
 
-        # Relative move
-        if move_data.steps is not None and move_data.direction is not None:
-            if move_data.steps <= 0:
-                raise HTTPException(status_code=400, detail="Steps must be positive")
+        logger.info("[Web GUI] User action: GoTo position %d (current: %d)", target, current_pos)
+        message = f"Moving to position {target}"
 
-            if move_data.direction not in ["in", "out"]:
-                raise HTTPException(status_code=400, detail="Direction must be 'in' or 'out'")
+    elif move_data.steps is not None and move_data.direction is not None:
+        # Relative move
+        if move_data.steps <= 0:
+            raise HTTPException(status_code=400, detail="Steps must be positive")
 
-            if move_data.direction == "out":
-                target = min(current_pos + move_data.steps, simulator._max_limit)
-            else:
-                target = max(current_pos - move_data.steps, simulator._min_limit)
+        if move_data.direction not in ["in", "out"]:
+            raise HTTPException(status_code=400, detail="Direction must be 'in' or 'out'")
 
-            if target != current_pos + move_data.steps * (1 if move_data.direction == "out" else -1):
-                logger.warning(f"Move clamped to limits: {current_pos} -> {target}")
+        if move_data.direction == "out":
+            target = min(current_pos + move_data.steps, simulator._max_limit)
+        else:
+            target = max(current_pos - move_data.steps, simulator._min_limit)
 
-            logger.info(f"[Web GUI] User action: {'+' if move_data.direction == 'out' else '-'}{move_data.steps} steps (from {current_pos} to {target})")
-            simulator.move_absolute(target)
+        if target != current_pos + move_data.steps * (1 if move_data.direction == "out" else -1):
+            logger.warning("Move clamped to limits: %d -> %d", current_pos, target)
 
-            return {
-                "status": "ok",
-                "message": f"Moving {move_data.direction} {move_data.steps} steps",
-                "from": current_pos,
-                "to": target
-            }
+        logger.info("[Web GUI] User action: %s%d steps (from %d to %d)",
+                    "+" if move_data.direction == "out" else "-", move_data.steps,
+                    current_pos, target)
+        message = f"Moving {move_data.direction} {move_data.steps} steps"
 
+    else:
         raise HTTPException(status_code=400, detail="Must specify either 'position' or 'steps' + 'direction'")
 
-    except RobofocusException as e:
-        logger.error(f"Robofocus error during move: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error during move: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Off the event loop: the simulator may sleep (response latency)
+    await asyncio.to_thread(simulator.move_absolute, target)
+
+    return {
+        "status": "ok",
+        "message": message,
+        "from": current_pos,
+        "to": target
+    }
 
 
 @router.post("/halt")
+@translate_errors(device_status=500)
 async def halt_simulator(request: Request):
     """Stop simulator movement immediately."""
     simulator = get_simulator(request)
+    current_pos = simulator._position
+
+    await asyncio.to_thread(simulator.halt)
+
+    logger.info("[Web GUI] User action: HALT (stopped at position %d)", current_pos)
 
-    try:
-        current_pos = simulator._position
-        simulator.halt()
-        logger.info(f"[Web GUI] User action: HALT (stopped at position {current_pos})")
-
-        return {
-            "status": "ok",
-            "message": "Movement halted",
-            "position": current_pos
-        }
-    except Exception as e:
-        logger.error(f"Error halting simulator: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "status": "ok",
+        "message": "Movement halted",
+        "position": current_pos
+    }
@@ -1,22 +1,78 @@
 """
 Logging setup with console and file handlers.
+
+Handlers run on a background QueueListener thread: logging calls on the
+serial, movement and request threads only enqueue the record.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 from robofocus_alpaca.config.models import LoggingConfig
 
 
-def setup_logging(config: LoggingConfig) -> None:
+# Active listener (replaced if setup_logging is called again)
+_listener: Optional[QueueListener] = None
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the timestamp once per second.
+
+    With a second-resolution datefmt every record in the same second gets
+    the same string, so localtime/strftime only run when the second changes.
+    Formatting happens on the single listener thread, so the cache needs no lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            # Default format includes milliseconds; nothing to reuse
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Registered once; stops whichever listener is active at exit
+atexit.register(_stop_listener)
+
+
+def setup_logging(config: LoggingConfig) -> QueueListener:
     """
     Configure logging for the application.
 
+    Records are queued by a QueueHandler on the root logger and written to
+    the console/file by a QueueListener thread. The listener is stopped
+    (and the queue flushed) at interpreter exit.
+
     Args:
         config: Logging configuration.
+
+    Returns:
+        The running QueueListener.
     """
+    global _listener
+    _stop_listener()
+
     # Create root logger
     logger = logging.getLogger()
     logger.setLevel(config.level)
@@ -25,7 +81,7 @@ def setup_logging(config: LoggingConfig) -> None:
     logger.handlers.clear()
 
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         "[%(asctime)s] %(levelname)s [%(name)s]: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
     )
@@ -34,9 +90,10 @@ def setup_logging(config: LoggingConfig) -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(config.level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (optional)
+    file_error = None
     if config.file:
         try:
             file_handler = RotatingFileHandler(
@@ -47,12 +104,23 @@ def setup_logging(config: LoggingConfig) -> None:
             )
             file_handler.setLevel(config.level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-            logger.info(f"Logging to file: {config.file}")
+            handlers.append(file_handler)
         except IOError as e:
-            logger.error(f"Failed to create log file {config.file}: {e}")
+            file_error = e
+
+    # Real handlers run on the listener thread
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener.start()
+
+    if file_error is not None:
+        logger.error(f"Failed to create log file {config.file}: {file_error}")
+    elif config.file:
+        logger.info(f"Logging to file: {config.file}")
 
     logger.info(f"Logging initialized at level: {config.level}")
+    return _listener
 
 
 def get_logger(name: str) -> logging.Logger: